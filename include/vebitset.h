@@ -64,6 +64,24 @@ void vebitset_destroy(vebitset_t handle);
  */
 void vebitset_insert(vebitset_t handle, size_t x);
 
+/**
+ * @brief Insert multiple elements into the bitset
+ *
+ * @param handle The bitset
+ * @param values Array of elements to insert
+ * @param count Number of elements in the array
+ */
+void vebitset_insert_many(vebitset_t handle, const size_t *values, size_t count);
+
+/**
+ * @brief Insert every element in the inclusive range [start, end]
+ *
+ * @param handle The bitset
+ * @param start The first element to insert
+ * @param end The last element to insert
+ */
+void vebitset_insert_range(vebitset_t handle, size_t start, size_t end);
+
 /**
  * @brief Remove an element from the bitset
  *
@@ -72,6 +90,15 @@ void vebitset_insert(vebitset_t handle, size_t x);
  */
 void vebitset_remove(vebitset_t handle, size_t x);
 
+/**
+ * @brief Remove multiple elements from the bitset
+ *
+ * @param handle The bitset
+ * @param values Array of elements to remove
+ * @param count Number of elements in the array
+ */
+void vebitset_remove_many(vebitset_t handle, const size_t *values, size_t count);
+
 /**
  * @brief Check if an element exists in the bitset
  *
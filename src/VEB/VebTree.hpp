@@ -34,11 +34,13 @@
 #ifndef VEBTREE_HPP
 #define VEBTREE_HPP
 
+#include <algorithm>     // std::equal, std::ranges::max
 #include <cstddef>       // std::ptrdiff_t, std::size_t
 #include <iterator>      // std::bidirectional_iterator_tag
 #include <optional>      // std::nullopt, std::optional
+#include <ranges>        // std::ranges::empty, std::ranges::forward_range, std::ranges::input_range
 #include <utility>       // std::exchange, std::move, std::unreachable
-#include <variant>       // std::holds_alternative, std::monostate, std::variant, std::visit
+#include <variant>       // std::get_if, std::holds_alternative, std::monostate, std::variant, std::visit
 #include <vector>        // std::vector
 
 #include "allocator/tracking_allocator.hpp"
@@ -231,6 +233,68 @@ public:
         }
     }
 
+    /**
+     * @brief Inserts a batch of elements into the VEB tree
+     * @param values The elements to insert
+     *
+     * Storage is grown once to fit the largest value, after which every
+     * element is inserted directly into the root node.
+     *
+     * Time complexity: O(k log log U) amortized
+     */
+    template <std::ranges::forward_range R>
+    inline void insert_many(const R& values) {
+        if (std::ranges::empty(values)) {
+            return;
+        }
+        insert(static_cast<std::size_t>(std::ranges::max(values)));
+        std::visit(
+            overload{
+                [](std::monostate) { std::unreachable(); },
+                [&](Node8& s) {
+                    for (const auto x : values) {
+                        s.insert(static_cast<Node8::index_t>(x));
+                    }
+                },
+                [&](auto& s) {
+                    for (const auto x : values) {
+                        s.insert(static_cast<index_t<decltype(s)>>(x), allocated_);
+                    }
+                },
+            },
+            storage_);
+    }
+
+    /**
+     * @brief Inserts every element in the inclusive range [start, end]
+     * @param start The first element to insert
+     * @param end The last element to insert
+     *
+     * Storage is grown once to fit `end`, after which the root fills the
+     * range cluster by cluster: only the two boundary clusters are written
+     * bit by bit, and every cluster strictly inside the range is marked
+     * implicitly full.
+     *
+     * Time complexity: O((k / 256 + 1) log log U)
+     */
+    inline void insert_range(std::size_t start, std::size_t end) {
+        if (start > end) {
+            return;
+        }
+        insert(end);
+        std::visit(
+            overload{
+                [](std::monostate) { std::unreachable(); },
+                [&](Node8& s) {
+                    s.insert_range(static_cast<Node8::index_t>(start), static_cast<Node8::index_t>(end));
+                },
+                [&](auto& s) {
+                    s.insert_range(static_cast<index_t<decltype(s)>>(start), static_cast<index_t<decltype(s)>>(end), allocated_);
+                },
+            },
+            storage_);
+    }
+
     /**
      * @brief Removes an element from the VEB tree
      * @param x The element to remove
@@ -256,6 +320,41 @@ public:
             storage_);
     }
 
+    /**
+     * @brief Removes a batch of elements from the VEB tree
+     * @param values The elements to remove
+     *
+     * Dispatches on the root node once for the whole batch and stops early
+     * once the tree becomes empty.
+     *
+     * Time complexity: O(k log log U)
+     */
+    template <std::ranges::input_range R>
+    inline void remove_many(const R& values) {
+        std::visit(
+            overload{
+                [](std::monostate) {},
+                [&](Node8& s) {
+                    for (const auto x : values) {
+                        if (x < s.universe_size() && s.remove(static_cast<Node8::index_t>(x))) {
+                            storage_ = std::monostate{};
+                            return;
+                        }
+                    }
+                },
+                [&](auto& s) {
+                    for (const auto x : values) {
+                        if (x < s.universe_size() && s.remove(static_cast<index_t<decltype(s)>>(x), allocated_)) {
+                            s.destroy(allocated_);
+                            storage_ = std::monostate{};
+                            return;
+                        }
+                    }
+                },
+            },
+            storage_);
+    }
+
     /**
      * @brief Checks if an element exists in the VEB tree
      * @param x The element to search for
@@ -422,6 +521,27 @@ public:
             storage_);
     }
 
+    /**
+     * @brief Calls `f` on every element in ascending order
+     * @param f Callable taking a std::size_t
+     *
+     * Walks each node's bitmaps directly instead of chaining `successor`
+     * calls, so dense clusters are decoded a word at a time.
+     *
+     * Time complexity: O(n)
+     */
+    template <typename F>
+    inline void for_each(F&& f) const {
+        std::visit(
+            overload{
+                [](std::monostate) {},
+                [&](const auto& s) {
+                    s.for_each([&](auto x) { f(static_cast<std::size_t>(x)); });
+                },
+            },
+            storage_);
+    }
+
     /**
      * @brief Converts the tree to a vector
      * @return A vector containing all elements
@@ -429,7 +549,10 @@ public:
      * Time complexity: O(n)
      */
     inline std::vector<std::size_t> to_vector() const {
-        return {begin(), end()};
+        std::vector<std::size_t> out;
+        out.reserve(size());
+        for_each([&](std::size_t x) { out.push_back(x); });
+        return out;
     }
 
     /**
@@ -613,33 +736,16 @@ public:
      * Time complexity: O(log log U) per node
      */
     inline VebTree& operator&=(const VebTree& other) {
+        if (this == &other || empty()) {
+            return *this;
+        }
+        if (other.empty() || *max() < *other.min() || *other.max() < *min()) {
+            clear();
+            return *this;
+        }
+
         std::visit(
             overload{
-                [](std::monostate, std::monostate) -> void {
-                },
-                [](std::monostate, const Node8&) -> void {
-                },
-                [](std::monostate, const Node16&) -> void {
-                },
-                [](std::monostate, const Node32&) -> void {
-                },
-                [](std::monostate, const Node64&) -> void {
-                },
-                [&](Node8&, std::monostate) -> void {
-                    storage_ = std::monostate{};
-                },
-                [&](Node16& a, std::monostate) -> void {
-                    a.destroy(allocated_);
-                    storage_ = std::monostate{};
-                },
-                [&](Node32& a, std::monostate) -> void {
-                    a.destroy(allocated_);
-                    storage_ = std::monostate{};
-                },
-                [&](Node64& a, std::monostate) -> void {
-                    a.destroy(allocated_);
-                    storage_ = std::monostate{};
-                },
                 [&](Node8& a, const Node8& b) -> void {
                     if (a.and_inplace(b)) {
                         storage_ = std::monostate{};
@@ -783,7 +889,7 @@ public:
      * Time complexity: O(log log U) per node
      */
     inline VebTree& operator|=(const VebTree& other) {
-        if (other.empty()) {
+        if (this == &other || other.empty()) {
             return *this;
         }
         if (empty()) {
@@ -885,6 +991,10 @@ public:
      * @return Reference to this tree after XOR
      */
     inline VebTree& operator^=(const VebTree& other) {
+        if (this == &other) {
+            clear();
+            return *this;
+        }
         if (other.empty()) {
             return *this;
         }
@@ -1035,17 +1145,23 @@ public:
 
     /**
      * @brief Equality comparison operator
+     *
+     * Two Node8 roots are compared word-by-word. Otherwise both trees are
+     * walked in lockstep after cheap size and min/max checks.
      */
     inline bool operator==(const VebTree& other) const {
-        if (size() != other.size()) {
+        if (this == &other) {
+            return true;
+        }
+        if (size() != other.size() || min() != other.min() || max() != other.max()) {
             return false;
         }
-        for (std::size_t element : *this) {
-            if (!other.contains(element)) {
-                return false;
-            }
+        const auto* lhs8{std::get_if<Node8>(&storage_)};
+        const auto* rhs8{std::get_if<Node8>(&other.storage_)};
+        if (lhs8 != nullptr && rhs8 != nullptr) {
+            return lhs8->bits_ == rhs8->bits_;
         }
-        return true;
+        return std::equal(begin(), end(), other.begin());
     }
 
     /**
@@ -127,12 +127,17 @@ private:
         return static_cast<index_t>((high << 8) | low);
     }
 
+    // Number of subnode_t slots backing a cluster_data_t with space for `cap` clusters: summary, unfilled, then the clusters.
+    static constexpr inline std::size_t allocation_size(std::size_t cap) {
+        return std::max(cap, 1uz) + 2;
+    }
+
     // Allocate a new cluster_data_t with space for `cap` clusters.
     // If `other` is provided, copy its summary and clusters up to `other_size` (if non-zero)
     // otherwise fall back to `other->size()`.
     static constexpr inline cluster_data_t* create(std::size_t& alloc, std::size_t cap, const cluster_data_t* other, std::size_t other_size) {
         allocator_t a{alloc};
-        auto* data = reinterpret_cast<cluster_data_t*>(a.allocate(cap + 2));
+        auto* data = reinterpret_cast<cluster_data_t*>(a.allocate(allocation_size(cap)));
         data->summary_ = other->summary_;
         data->unfilled_ = other->unfilled_;
         const auto copy_count{std::min(cap, other_size)};
@@ -222,14 +227,72 @@ private:
         set_len(len + 1);
     }
 
+    // Sets bits [lo, hi] of cluster `h`, the range counterpart of `emplace`.
+    // A cluster that is covered completely, or becomes full, is left implicitly filled.
+    constexpr inline void fill_cluster(subindex_t h, subindex_t lo, subindex_t hi, std::size_t& alloc) {
+        const auto whole{lo == 0 && hi == subnode_t::universe_size() - 1};
+        if (cluster_data_ == nullptr) {
+            if (whole) {
+                cluster_data_ = create(alloc, 0, subnode_t::new_with(h), subnode_t::new_all_but(h));
+                set_cap(0);
+                set_len(0);
+            } else {
+                auto cluster{subnode_t::new_with(lo)};
+                cluster.insert_range(lo, hi);
+                cluster_data_ = create(alloc, 1, h, cluster);
+                set_cap(1);
+                set_len(1);
+            }
+            return;
+        }
+
+        const auto idx{cluster_data_->index_of(h)};
+        if (cluster_data_->summary_.contains(h)) {
+            if (!cluster_data_->unfilled_.contains(h)) {
+                return;
+            }
+            cluster_data_->clusters_[idx].insert_range(lo, hi);
+            if (cluster_data_->clusters_[idx].full()) {
+                const auto size{get_len()};
+                const auto begin{cluster_data_->clusters_ + idx + 1};
+                const auto end{cluster_data_->clusters_ + size};
+                std::move(begin, end, begin - 1);
+                set_len(size - 1);
+                cluster_data_->unfilled_.remove(h);
+            }
+            return;
+        }
+
+        if (whole) {
+            cluster_data_->summary_.insert(h);
+            cluster_data_->unfilled_.remove(h);
+            return;
+        }
+
+        grow(alloc);
+
+        const auto len{get_len()};
+        if (idx < len) {
+            const auto begin{cluster_data_->clusters_ + idx};
+            const auto end{cluster_data_->clusters_ + len};
+            std::move_backward(begin, end, end + 1);
+        }
+        cluster_data_->clusters_[idx] = subnode_t::new_with(lo);
+        cluster_data_->clusters_[idx].insert_range(lo, hi);
+        cluster_data_->summary_.insert(h);
+        cluster_data_->unfilled_.insert(h);
+        set_len(len + 1);
+    }
+
     constexpr inline std::size_t get_cap() const {
         if (cluster_data_ == nullptr) {
             return 0;
         }
         return cap_ == 0 ? subnode_t::universe_size() : cap_;
     }
+    // `create` always reserves at least one cluster, so a stored 0 can only ever mean 256.
     constexpr inline void set_cap(std::size_t c) {
-        cap_ = static_cast<subindex_t>(c);
+        cap_ = static_cast<subindex_t>(std::max(c, 1uz));
     }
 
     constexpr inline std::size_t get_len() const {
@@ -314,9 +377,9 @@ public:
     constexpr inline void destroy(std::size_t& alloc) {
         if (cluster_data_ != nullptr) {
             allocator_t a{alloc};
-            a.deallocate(reinterpret_cast<subnode_t*>(cluster_data_), get_cap() + 2);
+            a.deallocate(reinterpret_cast<subnode_t*>(cluster_data_), allocation_size(get_cap()));
             cluster_data_ = nullptr;
-            set_cap(0);
+            cap_ = 0;
             set_len(0);
         }
     }
@@ -409,6 +472,43 @@ public:
         emplace(h, l, alloc);
     }
 
+    // Inserts every element of the inclusive range [lo, hi]. Only the two boundary clusters are
+    // touched bit by bit; clusters strictly inside the range become implicitly filled at once.
+    constexpr inline void insert_range(index_t lo, index_t hi, std::size_t& alloc) {
+        insert(lo, alloc);
+        insert(hi, alloc);
+        if (hi - lo < 2) {
+            return;
+        }
+
+        const auto top{static_cast<subindex_t>(subnode_t::universe_size() - 1)};
+        const auto [fh, fl] {decompose(static_cast<index_t>(lo + 1))};
+        const auto [lh, ll] {decompose(static_cast<index_t>(hi - 1))};
+        fill_cluster(fh, fl, fh == lh ? ll : top, alloc);
+        if (fh == lh) {
+            return;
+        }
+
+        if (lh - fh >= 2) {
+            const auto first{static_cast<subindex_t>(fh + 1)};
+            const auto last{static_cast<subindex_t>(lh - 1)};
+            const auto begin{cluster_data_->index_of(first)};
+            const auto end{cluster_data_->index_of(lh)};
+            if (begin < end) {
+                const auto len{get_len()};
+                std::move(cluster_data_->clusters_ + end, cluster_data_->clusters_ + len, cluster_data_->clusters_ + begin);
+                set_len(len - (end - begin));
+            }
+            auto span{subnode_t::new_with(first)};
+            span.insert_range(first, last);
+            cluster_data_->summary_.or_inplace(span);
+            span.not_inplace();
+            cluster_data_->unfilled_.and_inplace(span);
+        }
+
+        fill_cluster(lh, 0, ll, alloc);
+    }
+
     constexpr inline bool remove(index_t x, std::size_t& alloc) {
         if (x < min_ || x > max_) {
             return false;
@@ -441,6 +541,11 @@ public:
             }
         }
 
+        // x lies strictly between min and max, but there are no clusters to hold it
+        if (cluster_data_ == nullptr) {
+            return false;
+        }
+
         const auto [h, l] {decompose(x)};
 
         // If cluster exists implicitly (filled) we need to materialize it as all-but-l and mark it resident
@@ -577,6 +682,28 @@ public:
         return std::make_optional(min_);
     }
 
+    // Visits every element in ascending order. Resident clusters are packed in
+    // summary order, so a running index walks them without calling `index_of`.
+    template <typename F>
+    constexpr inline void for_each(F&& f) const {
+        f(min_);
+        if (cluster_data_ != nullptr) {
+            auto idx{0uz};
+            cluster_data_->summary_.for_each([&](subindex_t h) {
+                if (cluster_data_->unfilled_.contains(h)) {
+                    cluster_data_->clusters_[idx++].for_each([&](subindex_t l) { f(index(h, l)); });
+                } else {
+                    for (auto l{0uz}; l < subnode_t::universe_size(); ++l) {
+                        f(index(h, static_cast<subindex_t>(l)));
+                    }
+                }
+            });
+        }
+        if (max_ != min_) {
+            f(max_);
+        }
+    }
+
     constexpr inline std::size_t size() const {
         return count_range({});
     }
@@ -808,8 +935,12 @@ public:
         }
         const auto new_size{merge_resident.size()};
 
-        // If predicted upper limit of resident clusters fits in current capacity, use original clusters and do in-place merge
-        auto* merge_data{(new_size <= get_cap()) ? cluster_data_ : create(alloc, new_size, merge_summary, merge_unfilled)};
+        // If predicted upper limit of resident clusters fits in current capacity, use original clusters and do in-place merge.
+        // This is only safe if every cluster written consumes one of ours first, ie. other has no resident cluster outside our summary.
+        auto o_only{s_summary};
+        o_only.not_inplace();
+        const auto in_place{new_size <= get_cap() && o_only.and_inplace(o_resident)};
+        auto* merge_data{in_place ? cluster_data_ : create(alloc, new_size, merge_summary, merge_unfilled)};
         auto* merge_clusters{merge_data->clusters_};
 
         auto i{0uz};
@@ -886,6 +1017,9 @@ public:
         if (!min_out) {
             min_ = new_min.value();
         }
+        if (new_max.has_value()) {
+            max_ = new_max.value();
+        }
 
         // reduce future work by pre computing summary intersection. if empty, we are done
         // makes iterating clusters easier as we only need to consider clusters that we know will survive intersection
@@ -966,8 +1100,13 @@ public:
         const auto materialize_max{!new_max.has_value() && int_summary.min() != int_summary.max() && resident.max() != int_summary.max()};
         const auto resident_count{resident.size() + materialize_min + materialize_max};
 
-        // If predicted resident clusters exceed capacity, allocate a new cluster_data_t and write into it
-        auto* int_data{(resident_count <= get_cap()) ? cluster_data_ : create(alloc, resident_count, int_summary, int_unfilled)};
+        // If predicted resident clusters exceed capacity, allocate a new cluster_data_t and write into it.
+        // Likewise if a cluster could be written before the one of ours it replaces is read: a materialized min,
+        // or a cluster resident only in other.
+        auto o_only{s_resident};
+        o_only.not_inplace();
+        const auto in_place{resident_count <= get_cap() && !materialize_min && o_only.and_inplace(resident)};
+        auto* int_data{in_place ? cluster_data_ : create(alloc, resident_count, int_summary, int_unfilled)};
         auto* int_clusters{int_data->clusters_};
 
         auto i{0uz};
@@ -1016,7 +1155,7 @@ public:
                 if (int_summary.remove(h)) {
                     // last element removed -> update min/max and return
                     if (int_data != cluster_data_) {
-                        allocator_t{alloc}.deallocate(reinterpret_cast<subnode_t*>(int_data), resident_count + 2);
+                        allocator_t{alloc}.deallocate(reinterpret_cast<subnode_t*>(int_data), allocation_size(resident_count));
                     }
                     return update_minmax();
                 }
@@ -1038,7 +1177,7 @@ public:
                         // node is now clusterless, but not empty since min_ at least exists.
                         // update max_ and exit.
                         if (int_data != cluster_data_) {
-                            allocator_t{alloc}.deallocate(reinterpret_cast<subnode_t*>(int_data), resident_count + 2);
+                            allocator_t{alloc}.deallocate(reinterpret_cast<subnode_t*>(int_data), allocation_size(resident_count));
                         }
                         destroy(alloc);
                         max_ = new_max.has_value() ? new_max.value() : min_;
@@ -1057,7 +1196,7 @@ public:
         }
 
         if (!new_max.has_value()) {
-            if (const auto max_hi{cluster_data_->summary_.max()}; !resident.contains(max_hi)) {
+            if (const auto max_hi{cluster_data_->summary_.max()}; !cluster_data_->unfilled_.contains(max_hi)) {
                 max_ = index(max_hi, static_cast<subindex_t>(255));
                 cluster_data_->unfilled_.insert(max_hi);
                 cluster_data_->clusters_[k++] = subnode_t::new_all_but(255);
@@ -1102,7 +1241,8 @@ public:
                     insert(o_min, alloc);
                 }
             }
-            if (s_max > o_max && min_ != o_max) {
+            // a single element other was already toggled above as o_min
+            if (s_max > o_max && min_ != o_max && o_max != o_min) {
                 if (contains(o_max)) {
                     remove(o_max, alloc);
                 } else {
@@ -1136,8 +1276,9 @@ public:
             const auto o_resident{other.cluster_data_->resident_mask()};
             const auto* o_clusters{other.cluster_data_->clusters_};
 
-            // pre compute maximal merged residency. if the size fits in capacity, we can do everything in place
-            // this probably isn't the common case, but it's worth optimizing for nonetheless to avoid unnecessary allocations and copies
+            // pre compute maximal merged residency. if the size fits in capacity, and every cluster written consumes one of ours first,
+            // we can do everything in place. this probably isn't the common case, but it's worth optimizing for nonetheless to avoid
+            // unnecessary allocations and copies
             auto diff_summary{s_summary};
             diff_summary.or_inplace(o_summary);
             auto diff_unfilled{s_unfilled};
@@ -1145,8 +1286,11 @@ public:
             auto diff_resident{s_resident};
             diff_resident.or_inplace(o_resident);
             const auto resident_count{diff_resident.size()};
+            auto o_only{s_resident};
+            o_only.not_inplace();
+            const auto in_place{resident_count <= get_cap() && o_only.and_inplace(o_resident)};
 
-            auto* diff_data{(resident_count <= get_cap()) ? cluster_data_ : create(alloc, resident_count, diff_summary, diff_unfilled)};
+            auto* diff_data{in_place ? cluster_data_ : create(alloc, resident_count, diff_summary, diff_unfilled)};
             auto* diff_clusters{diff_data->clusters_};
 
             auto i{0uz};
@@ -1163,6 +1307,9 @@ public:
                     diff_clusters[k] = s_clusters[i++];
                     if (diff_clusters[k].xor_inplace(o_clusters[j++])) {
                         if (diff_summary.remove(h)) {
+                            if (diff_data != cluster_data_) {
+                                allocator_t{alloc}.deallocate(reinterpret_cast<subnode_t*>(diff_data), allocation_size(resident_count));
+                            }
                             destroy(alloc);
                             return update_minmax();
                         }
@@ -1185,6 +1332,9 @@ public:
                     ++k;
                 } else if (in_s && in_o) { // implicit in s and o. result is empty
                     if (diff_summary.remove(h)) {
+                        if (diff_data != cluster_data_) {
+                            allocator_t{alloc}.deallocate(reinterpret_cast<subnode_t*>(diff_data), allocation_size(resident_count));
+                        }
                         destroy(alloc);
                         return update_minmax();
                     }
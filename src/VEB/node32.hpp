@@ -70,6 +70,34 @@ private:
 
     constexpr inline explicit Node32() = default;
 
+    // Sets [lo, hi] in cluster `h`. A cluster that is covered completely, or becomes full,
+    // is left implicit.
+    constexpr inline void fill_cluster(subindex_t h, subindex_t lo, subindex_t hi, std::size_t& alloc) {
+        if (cluster_data_ == nullptr) {
+            allocator_t a{alloc};
+            cluster_data_ = a.allocate(1);
+            a.construct(cluster_data_, h, alloc);
+        } else if (const auto it{cluster_data_->clusters.find(h)}; it != cluster_data_->clusters.end()) {
+            auto& cluster{const_cast<subnode_t&>(*it)};
+            cluster.insert_range(lo, hi, alloc);
+            if (cluster.full()) {
+                cluster.destroy(alloc);
+                cluster_data_->clusters.erase(it);
+            }
+            return;
+        } else if (cluster_data_->summary.contains(h)) {
+            return;
+        } else {
+            cluster_data_->summary.insert(h, alloc);
+        }
+
+        if (lo != 0 || hi != subnode_t::universe_size() - 1) {
+            auto cluster{subnode_t::new_with(h, lo)};
+            cluster.insert_range(lo, hi, alloc);
+            cluster_data_->clusters.emplace(std::move(cluster));
+        }
+    }
+
 public:
     static constexpr inline Node32 new_with(index_t x) {
         Node32 node{};
@@ -207,6 +235,41 @@ public:
         }
     }
 
+    // Inserts every element of the inclusive range [lo, hi]. Clusters strictly inside the range
+    // are dropped and marked in the summary, which leaves them implicitly full.
+    constexpr inline void insert_range(index_t lo, index_t hi, std::size_t& alloc) {
+        insert(lo, alloc);
+        insert(hi, alloc);
+        if (hi - lo < 2) {
+            return;
+        }
+
+        const auto top{static_cast<subindex_t>(subnode_t::universe_size() - 1)};
+        const auto [fh, fl] {decompose(lo + 1)};
+        const auto [lh, ll] {decompose(hi - 1)};
+        fill_cluster(fh, fl, fh == lh ? ll : top, alloc);
+        if (fh == lh) {
+            return;
+        }
+
+        if (lh - fh >= 2) {
+            const auto first{static_cast<subindex_t>(fh + 1)};
+            const auto last{static_cast<subindex_t>(lh - 1)};
+            auto& clusters{cluster_data_->clusters};
+            for (auto it{clusters.begin()}; it != clusters.end();) {
+                if (first <= it->key() && it->key() <= last) {
+                    const_cast<subnode_t&>(*it).destroy(alloc);
+                    it = clusters.erase(it);
+                } else {
+                    ++it;
+                }
+            }
+            cluster_data_->summary.insert_range(first, last, alloc);
+        }
+
+        fill_cluster(lh, 0, ll, alloc);
+    }
+
     constexpr inline bool remove(index_t x, std::size_t& alloc) {
         if (x < min_ || x > max_) {
             return false;
@@ -346,6 +409,26 @@ public:
         return std::make_optional(min_);
     }
 
+    // Visits every element in ascending order.
+    template <typename F>
+    constexpr inline void for_each(F&& f) const {
+        f(min_);
+        if (cluster_data_ != nullptr) {
+            cluster_data_->summary.for_each([&](subindex_t h) {
+                if (const auto it{cluster_data_->clusters.find(h)}; it != cluster_data_->clusters.end()) {
+                    it->for_each([&](subindex_t l) { f(index(h, l)); });
+                } else {
+                    for (auto l{0uz}; l < subnode_t::universe_size(); ++l) {
+                        f(index(h, static_cast<subindex_t>(l)));
+                    }
+                }
+            });
+        }
+        if (max_ != min_) {
+            f(max_);
+        }
+    }
+
     constexpr inline std::size_t size() const {
         auto acc{(min_ == max_) ? 1uz : 2uz};
 
@@ -719,7 +802,8 @@ public:
                 insert(o_min, alloc);
             }
         }
-        if (s_max > o_max && min_ != o_max) {
+        // a single element other was already toggled above as o_min
+        if (s_max > o_max && min_ != o_max && o_max != o_min) {
             if (contains(o_max)) {
                 remove(o_max, alloc);
             } else {
@@ -191,6 +191,34 @@ public:
         }
     }
 
+    // Inserts every element of the inclusive range [lo, hi]. Node64 has no implicit clusters,
+    // so each covered Node32 is materialized and filled with its own range insert.
+    constexpr inline void insert_range(index_t lo, index_t hi, std::size_t& alloc) {
+        insert(lo, alloc);
+        insert(hi, alloc);
+        if (hi - lo < 2) {
+            return;
+        }
+
+        const auto top{static_cast<subindex_t>(subnode_t::universe_size() - 1)};
+        const auto [fh, fl] {decompose(lo + 1)};
+        const auto [lh, ll] {decompose(hi - 1)};
+        for (auto h{static_cast<index_t>(fh)}; h <= lh; ++h) {
+            const auto cl{h == fh ? fl : static_cast<subindex_t>(0)};
+            const auto ch{h == lh ? ll : top};
+            const auto key{static_cast<subindex_t>(h)};
+            if (cluster_data_ == nullptr) {
+                allocator_t a{alloc};
+                cluster_data_ = a.allocate(1);
+                a.construct(cluster_data_, key, alloc);
+            } else if (!cluster_data_->summary.contains(key)) {
+                cluster_data_->summary.insert(key, alloc);
+            }
+            const auto it{cluster_data_->clusters.try_emplace(key, subnode_t::new_with(cl)).first};
+            it->second.insert_range(cl, ch, alloc);
+        }
+    }
+
     constexpr inline bool remove(index_t x, std::size_t& alloc) {
         if (x < min_ || x > max_) {
             return false;
@@ -317,6 +345,20 @@ public:
         return std::make_optional(min_);
     }
 
+    // Visits every element in ascending order.
+    template <typename F>
+    constexpr inline void for_each(F&& f) const {
+        f(min_);
+        if (cluster_data_ != nullptr) {
+            cluster_data_->summary.for_each([&](subindex_t h) {
+                cluster_data_->clusters.at(h).for_each([&](subindex_t l) { f(index(h, l)); });
+            });
+        }
+        if (max_ != min_) {
+            f(max_);
+        }
+    }
+
     constexpr inline std::size_t size() const {
         const auto base_count{(min_ == max_) ? 1uz : 2uz};
 
@@ -519,7 +561,13 @@ public:
 
         // iterate only clusters surviving the summary intersection
         for (auto s_it{s_clusters.begin()}; s_it != s_clusters.end(); ) {
-            if (auto& [key, cluster] = *s_it; !s_summary.contains(key) || cluster.and_inplace(o_clusters.at(key), alloc)) {
+            // copy the key, the node holding it is freed by erase
+            const auto key{s_it->first};
+            auto& cluster{s_it->second};
+            if (!s_summary.contains(key)) {
+                cluster.destroy(alloc);
+                s_it = s_clusters.erase(s_it);
+            } else if (cluster.and_inplace(o_clusters.at(key), alloc)) {
                 cluster.destroy(alloc);
                 s_it = s_clusters.erase(s_it);
                 if (s_summary.remove(key, alloc)) {
@@ -603,7 +651,8 @@ public:
                 insert(o_min, alloc);
             }
         }
-        if (s_max > o_max && min_ != o_max) {
+        // a single element other was already toggled above as o_min
+        if (s_max > o_max && min_ != o_max && o_max != o_min) {
             if (contains(o_max)) {
                 remove(o_max, alloc);
             } else {
@@ -110,6 +110,17 @@ public:
         bits_[word_idx] |= (1ULL << bit_idx);
     }
 
+    // Sets every bit in the inclusive range [lo, hi] a word at a time.
+    constexpr inline void insert_range(index_t lo, index_t hi) {
+        const auto [lw, lb] {decompose(lo)};
+        const auto [hw, hb] {decompose(hi)};
+        for (auto word{lw}; word <= hw; ++word) {
+            const auto lmask{word == lw ? ~0ULL << lb : ~0ULL};
+            const auto hmask{word == hw ? ~0ULL >> (bits_per_word - 1 - hb) : ~0ULL};
+            bits_[word] |= lmask & hmask;
+        }
+    }
+
     constexpr inline bool remove(index_t x) {
         const auto [word_idx, bit_idx] {decompose(x)};
 
@@ -172,6 +183,16 @@ public:
         return std::nullopt;
     }
 
+    // Visits every element in ascending order, clearing one bit per step.
+    template <typename F>
+    constexpr inline void for_each(F&& f) const {
+        for (subindex_t word{}; word < num_words; ++word) {
+            for (auto w{bits_[word]}; w != 0; w &= w - 1) {
+                f(index(word, static_cast<subindex_t>(std::countr_zero(w))));
+            }
+        }
+    }
+
     constexpr inline std::size_t size() const {
         return std::popcount(bits_[0]) + std::popcount(bits_[1]) +
                std::popcount(bits_[2]) + std::popcount(bits_[3]);
@@ -234,9 +255,9 @@ public:
     //  1 | 1 |  0 |   1   |   1   |   0   |   0
 
     constexpr inline bool not_inplace() {
-        auto v{load()};
-        store(~v);
-        return empty();
+        const auto v{~load()};
+        store(v);
+        return xsimd::all(v == 0);
     }
 
     constexpr inline bool or_inplace(const Node8& other) {
@@ -248,25 +269,22 @@ public:
     }
 
     constexpr inline bool xor_inplace(const Node8& other) {
-        auto v1{load()};
-        auto v2{other.load()};
-        store(v1 ^ v2);
-        return empty();
+        const auto v{load() ^ other.load()};
+        store(v);
+        return xsimd::all(v == 0);
     }
 
     constexpr inline bool and_inplace(const Node8& other) {
-        auto v1{load()};
-        auto v2{other.load()};
-        store(v1 & v2);
-        return empty();
+        const auto v{load() & other.load()};
+        store(v);
+        return xsimd::all(v == 0);
     }
 
     // difference: A \ B
     constexpr inline bool andnot_inplace(const Node8& other) {
-        auto v1{load()};
-        auto v2{other.load()};
-        store(xsimd::bitwise_andnot(v2, v1));
-        return empty();
+        const auto v{xsimd::bitwise_andnot(other.load(), load())};
+        store(v);
+        return xsimd::all(v == 0);
     }
 };
 
@@ -6,6 +6,7 @@
 #include <cstdlib>
 #include <cstring>
 #include <cassert>
+#include <span>
 #include <string_view>
 #include <string>
 
@@ -40,11 +41,28 @@ void vebitset_insert(vebitset_t handle, size_t x) {
     handle->insert(x);
 }
 
+void vebitset_insert_many(vebitset_t handle, const size_t *values, size_t count) {
+    assert(handle != nullptr);
+    assert(values != nullptr || count == 0);
+    handle->insert_many(std::span{values, count});
+}
+
+void vebitset_insert_range(vebitset_t handle, size_t start, size_t end) {
+    assert(handle != nullptr);
+    handle->insert_range(start, end);
+}
+
 void vebitset_remove(vebitset_t handle, size_t x) {
     assert(handle != nullptr);
     handle->remove(x);
 }
 
+void vebitset_remove_many(vebitset_t handle, const size_t *values, size_t count) {
+    assert(handle != nullptr);
+    assert(values != nullptr || count == 0);
+    handle->remove_many(std::span{values, count});
+}
+
 bool vebitset_contains(const_vebitset_t handle, size_t x) {
     assert(handle != nullptr);
     return handle->contains(x);
@@ -101,9 +119,7 @@ size_t* vebitset_to_array(const_vebitset_t handle, size_t *out_len) {
     std::size_t* array = static_cast<std::size_t*>(malloc(len * sizeof(std::size_t)));
     if (array != nullptr) {
         std::size_t i = 0;
-        for (auto v : *handle) {
-            array[i++] = v;
-        }
+        handle->for_each([&](std::size_t v) { array[i++] = v; });
     }
     return array;
 }
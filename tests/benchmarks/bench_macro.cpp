@@ -2,12 +2,25 @@
 #include "VEB/VebTree.hpp"
 #include <nanobench.h>
 #include <roaring/roaring.hh>
+#include <map>
 #include <vector>
 #include <algorithm>
 #include <random>
-#include <fstream>
-
-extern std::ofstream g_output;
+#include <utility>
+#include <string>
+
+static constexpr uint32_t UNIVERSE_SIZE = 1000000;
+static const std::vector<double> DENSITIES = {0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99};
+
+// Distinct random fixtures are generated once per size and shared by every benchmark at that density.
+static const std::vector<uint32_t>& unique_fixture(uint32_t count) {
+    static std::map<uint32_t, std::vector<uint32_t>> cache;
+    auto [it, inserted] = cache.try_emplace(count);
+    if (inserted) {
+        it->second = generate_unique_values(count, UNIVERSE_SIZE);
+    }
+    return it->second;
+}
 
 std::vector<uint32_t> generate_clustered_values(uint32_t count, uint32_t universe_size) {
     std::vector<uint32_t> values;
@@ -39,23 +52,23 @@ std::vector<uint32_t> generate_sequential_values(uint32_t count, uint32_t univer
     return values;
 }
 
-void bench_macro_insert() {
-    std::vector<double> densities = {0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99};
-    
-    for (double density : densities) {
-        const uint32_t UNIVERSE_SIZE = 1000000;
+using value_generator_t = std::vector<uint32_t> (*)(uint32_t, uint32_t);
+
+static void bench_macro_insert_pattern(const std::string& pattern, const std::string& scenario, value_generator_t generate) {
+    for (double density : DENSITIES) {
+        const std::string density_tag = std::to_string(static_cast<int>(density * 100));
         const uint32_t ELEMENT_COUNT = static_cast<uint32_t>(UNIVERSE_SIZE * density);
         
-        auto test_data = generate_random_values(ELEMENT_COUNT, UNIVERSE_SIZE);
+        auto test_data = generate(ELEMENT_COUNT, UNIVERSE_SIZE);
 
         VebTree veb_tree;
         std::vector<bool> vec_bool(UNIVERSE_SIZE);
         roaring::Roaring roaring_tree;
         
         auto veb_bench = run_macro_benchmark(
-            "veb_insert_random_" + std::to_string(static_cast<int>(density * 100)),
+            "veb_insert_" + pattern + "_" + density_tag,
             "vebitset",
-            "insert_random",
+            scenario,
             density,
             ELEMENT_COUNT,
             [&]() {
@@ -66,12 +79,12 @@ void bench_macro_insert() {
                 ankerl::nanobench::doNotOptimizeAway(&veb_tree);
             },
             [&]() { return veb_tree.get_allocated_bytes(); });
-        ankerl::nanobench::render(benchmark_json_template(), veb_bench, g_output);
+        record_result(std::move(veb_bench));
 
         auto vec_bench = run_macro_benchmark(
-            "vector_bool_insert_random_" + std::to_string(static_cast<int>(density * 100)),
+            "vector_bool_insert_" + pattern + "_" + density_tag,
             "vector<bool>",
-            "insert_random",
+            scenario,
             density,
             ELEMENT_COUNT,
             [&]() {
@@ -82,12 +95,12 @@ void bench_macro_insert() {
                 ankerl::nanobench::doNotOptimizeAway(&vec_bool);
             },
             [&]() { return vec_bool.capacity() / 8; });
-        ankerl::nanobench::render(benchmark_json_template(), vec_bench, g_output);
+        record_result(std::move(vec_bench));
 
         auto roaring_bench = run_macro_benchmark(
-            "roaring_insert_random_" + std::to_string(static_cast<int>(density * 100)),
+            "roaring_insert_" + pattern + "_" + density_tag,
             "roaring",
-            "insert_random",
+            scenario,
             density,
             ELEMENT_COUNT,
             [&]() {
@@ -98,151 +111,33 @@ void bench_macro_insert() {
                 ankerl::nanobench::doNotOptimizeAway(&roaring_tree);
             },
             [&]() { return roaring_tree.getSizeInBytes(true); });
-        ankerl::nanobench::render(benchmark_json_template(), roaring_bench, g_output);
+        record_result(std::move(roaring_bench));
     }
 }
 
-void bench_macro_insert_sequential() {
-    std::vector<double> densities = {0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99};
-    
-    for (double density : densities) {
-        const uint32_t UNIVERSE_SIZE = 1000000;
-        const uint32_t ELEMENT_COUNT = static_cast<uint32_t>(UNIVERSE_SIZE * density);
-        
-        auto test_data = generate_sequential_values(ELEMENT_COUNT, UNIVERSE_SIZE);
-
-        VebTree veb_tree;
-        std::vector<bool> vec_bool(UNIVERSE_SIZE);
-        roaring::Roaring roaring_tree;
-        
-        auto veb_bench = run_macro_benchmark(
-            "veb_insert_seq_" + std::to_string(static_cast<int>(density * 100)),
-            "vebitset",
-            "insert_sequential",
-            density,
-            ELEMENT_COUNT,
-            [&]() {
-                veb_tree.clear();
-                for (uint32_t val : test_data) {
-                    veb_tree.insert(val);
-                }
-                ankerl::nanobench::doNotOptimizeAway(&veb_tree);
-            },
-            [&]() { return veb_tree.get_allocated_bytes(); });
-        ankerl::nanobench::render(benchmark_json_template(), veb_bench, g_output);
-
-        auto vec_bench = run_macro_benchmark(
-            "vector_bool_insert_seq_" + std::to_string(static_cast<int>(density * 100)),
-            "vector<bool>",
-            "insert_sequential",
-            density,
-            ELEMENT_COUNT,
-            [&]() {
-                std::fill(vec_bool.begin(), vec_bool.end(), false);
-                for (uint32_t val : test_data) {
-                    vec_bool[val] = true;
-                }
-                ankerl::nanobench::doNotOptimizeAway(&vec_bool);
-            },
-            [&]() { return vec_bool.capacity() / 8; });
-        ankerl::nanobench::render(benchmark_json_template(), vec_bench, g_output);
+void bench_macro_insert() {
+    bench_macro_insert_pattern("random", "insert_random", [](uint32_t count, uint32_t) { return unique_fixture(count); });
+}
 
-        auto roaring_bench = run_macro_benchmark(
-            "roaring_insert_seq_" + std::to_string(static_cast<int>(density * 100)),
-            "roaring",
-            "insert_sequential",
-            density,
-            ELEMENT_COUNT,
-            [&]() {
-                roaring_tree.clear();
-                for (uint32_t val : test_data) {
-                    roaring_tree.add(val);
-                }
-                ankerl::nanobench::doNotOptimizeAway(&roaring_tree);
-            },
-            [&]() { return roaring_tree.getSizeInBytes(true); });
-        ankerl::nanobench::render(benchmark_json_template(), roaring_bench, g_output);
-    }
+void bench_macro_insert_sequential() {
+    bench_macro_insert_pattern("seq", "insert_sequential", generate_sequential_values);
 }
 
 void bench_macro_insert_clustered() {
-    std::vector<double> densities = {0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99};
-    
-    for (double density : densities) {
-        const uint32_t UNIVERSE_SIZE = 1000000;
-        const uint32_t ELEMENT_COUNT = static_cast<uint32_t>(UNIVERSE_SIZE * density);
-        
-        auto test_data = generate_clustered_values(ELEMENT_COUNT, UNIVERSE_SIZE);
-
-        VebTree veb_tree;
-        std::vector<bool> vec_bool(UNIVERSE_SIZE);
-        roaring::Roaring roaring_tree;
-        
-        auto veb_bench = run_macro_benchmark(
-            "veb_insert_clustered_" + std::to_string(static_cast<int>(density * 100)),
-            "vebitset",
-            "insert_clustered",
-            density,
-            ELEMENT_COUNT,
-            [&]() {
-                veb_tree.clear();
-                for (uint32_t val : test_data) {
-                    veb_tree.insert(val);
-                }
-                ankerl::nanobench::doNotOptimizeAway(&veb_tree);
-            },
-            [&]() { return veb_tree.get_allocated_bytes(); });
-        ankerl::nanobench::render(benchmark_json_template(), veb_bench, g_output);
-
-        auto vec_bench = run_macro_benchmark(
-            "vector_bool_insert_clustered_" + std::to_string(static_cast<int>(density * 100)),
-            "vector<bool>",
-            "insert_clustered",
-            density,
-            ELEMENT_COUNT,
-            [&]() {
-                std::fill(vec_bool.begin(), vec_bool.end(), false);
-                for (uint32_t val : test_data) {
-                    vec_bool[val] = true;
-                }
-                ankerl::nanobench::doNotOptimizeAway(&vec_bool);
-            },
-            [&]() { return vec_bool.capacity() / 8; });
-        ankerl::nanobench::render(benchmark_json_template(), vec_bench, g_output);
-
-        auto roaring_bench = run_macro_benchmark(
-            "roaring_insert_clustered_" + std::to_string(static_cast<int>(density * 100)),
-            "roaring",
-            "insert_clustered",
-            density,
-            ELEMENT_COUNT,
-            [&]() {
-                roaring_tree.clear();
-                for (uint32_t val : test_data) {
-                    roaring_tree.add(val);
-                }
-                ankerl::nanobench::doNotOptimizeAway(&roaring_tree);
-            },
-            [&]() { return roaring_tree.getSizeInBytes(true); });
-        ankerl::nanobench::render(benchmark_json_template(), roaring_bench, g_output);
-    }
+    bench_macro_insert_pattern("clustered", "insert_clustered", generate_clustered_values);
 }
 
 void bench_macro_contains() {
-    std::vector<double> densities = {0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99};
-    
-    for (double density : densities) {
-        const uint32_t UNIVERSE_SIZE = 1000000;
+    for (double density : DENSITIES) {
+        const std::string density_tag = std::to_string(static_cast<int>(density * 100));
         const uint32_t ELEMENT_COUNT = static_cast<uint32_t>(UNIVERSE_SIZE * density);
         const uint32_t QUERY_COUNT = 100000;
         
-        auto insert_data = generate_random_values(ELEMENT_COUNT, UNIVERSE_SIZE);
+        const auto& insert_data = unique_fixture(ELEMENT_COUNT);
         auto query_data = generate_random_values(QUERY_COUNT, UNIVERSE_SIZE);
 
         VebTree veb_tree;
-        for (uint32_t val : insert_data) {
-            veb_tree.insert(val);
-        }
+        veb_tree.insert_many(insert_data);
         
         std::vector<bool> vec_bool(UNIVERSE_SIZE);
         for (uint32_t val : insert_data) {
@@ -250,12 +145,10 @@ void bench_macro_contains() {
         }
         
         roaring::Roaring roaring_tree;
-        for (uint32_t val : insert_data) {
-            roaring_tree.add(val);
-        }
+        roaring_tree.addMany(insert_data.size(), insert_data.data());
 
         auto veb_bench = run_macro_benchmark(
-            "veb_contains_" + std::to_string(static_cast<int>(density * 100)),
+            "veb_contains_" + density_tag,
             "vebitset",
             "contains",
             density,
@@ -268,10 +161,10 @@ void bench_macro_contains() {
                 ankerl::nanobench::doNotOptimizeAway(count);
             },
             [&]() { return veb_tree.get_allocated_bytes(); });
-        ankerl::nanobench::render(benchmark_json_template(), veb_bench, g_output);
+        record_result(std::move(veb_bench));
 
         auto vec_bench = run_macro_benchmark(
-            "vector_bool_contains_" + std::to_string(static_cast<int>(density * 100)),
+            "vector_bool_contains_" + density_tag,
             "vector<bool>",
             "contains",
             density,
@@ -284,10 +177,10 @@ void bench_macro_contains() {
                 ankerl::nanobench::doNotOptimizeAway(count);
             },
             [&]() { return vec_bool.capacity() / 8; });
-        ankerl::nanobench::render(benchmark_json_template(), vec_bench, g_output);
+        record_result(std::move(vec_bench));
 
         auto roaring_bench = run_macro_benchmark(
-            "roaring_contains_" + std::to_string(static_cast<int>(density * 100)),
+            "roaring_contains_" + density_tag,
             "roaring",
             "contains",
             density,
@@ -300,25 +193,21 @@ void bench_macro_contains() {
                 ankerl::nanobench::doNotOptimizeAway(count);
             },
             [&]() { return roaring_tree.getSizeInBytes(true); });
-        ankerl::nanobench::render(benchmark_json_template(), roaring_bench, g_output);
+        record_result(std::move(roaring_bench));
     }
 }
 
 void bench_macro_remove() {
-    std::vector<double> densities = {0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99};
-    
-    for (double density : densities) {
-        const uint32_t UNIVERSE_SIZE = 1000000;
+    for (double density : DENSITIES) {
+        const std::string density_tag = std::to_string(static_cast<int>(density * 100));
         const uint32_t ELEMENT_COUNT = static_cast<uint32_t>(UNIVERSE_SIZE * density);
         const uint32_t REMOVE_COUNT = ELEMENT_COUNT / 2;
         
-        auto insert_data = generate_random_values(ELEMENT_COUNT, UNIVERSE_SIZE);
-        auto remove_data = generate_random_values(REMOVE_COUNT, UNIVERSE_SIZE);
+        const auto& insert_data = unique_fixture(ELEMENT_COUNT);
+        const std::vector<uint32_t> remove_data(insert_data.begin(), insert_data.begin() + REMOVE_COUNT);
 
         VebTree veb_tree;
-        for (uint32_t val : insert_data) {
-            veb_tree.insert(val);
-        }
+        veb_tree.insert_many(insert_data);
         
         std::vector<bool> vec_bool(UNIVERSE_SIZE);
         for (uint32_t val : insert_data) {
@@ -326,70 +215,67 @@ void bench_macro_remove() {
         }
         
         roaring::Roaring roaring_tree;
-        for (uint32_t val : insert_data) {
-            roaring_tree.add(val);
-        }
+        roaring_tree.addMany(insert_data.size(), insert_data.data());
 
-        auto veb_bench = run_macro_benchmark(
-            "veb_remove_" + std::to_string(static_cast<int>(density * 100)),
+        auto veb_bench = run_consuming_macro_benchmark(
+            "veb_remove_" + density_tag,
             "vebitset",
             "remove",
             density,
             REMOVE_COUNT,
-            [&]() {
+            veb_tree,
+            [&](VebTree& tree) {
                 for (uint32_t val : remove_data) {
-                    veb_tree.remove(val);
+                    tree.remove(val);
                 }
-                ankerl::nanobench::doNotOptimizeAway(&veb_tree);
+                ankerl::nanobench::doNotOptimizeAway(&tree);
             },
             [&]() { return veb_tree.get_allocated_bytes(); });
-        ankerl::nanobench::render(benchmark_json_template(), veb_bench, g_output);
+        record_result(std::move(veb_bench));
 
-        auto vec_bench = run_macro_benchmark(
-            "vector_bool_remove_" + std::to_string(static_cast<int>(density * 100)),
+        auto vec_bench = run_consuming_macro_benchmark(
+            "vector_bool_remove_" + density_tag,
             "vector<bool>",
             "remove",
             density,
             REMOVE_COUNT,
-            [&]() {
+            vec_bool,
+            [&](std::vector<bool>& bits) {
                 for (uint32_t val : remove_data) {
-                    vec_bool[val] = false;
+                    bits[val] = false;
                 }
-                ankerl::nanobench::doNotOptimizeAway(&vec_bool);
+                ankerl::nanobench::doNotOptimizeAway(&bits);
             },
             [&]() { return vec_bool.capacity() / 8; });
-        ankerl::nanobench::render(benchmark_json_template(), vec_bench, g_output);
+        record_result(std::move(vec_bench));
 
-        auto roaring_bench = run_macro_benchmark(
-            "roaring_remove_" + std::to_string(static_cast<int>(density * 100)),
+        auto roaring_bench = run_consuming_macro_benchmark(
+            "roaring_remove_" + density_tag,
             "roaring",
             "remove",
             density,
             REMOVE_COUNT,
-            [&]() {
+            roaring_tree,
+            [&](roaring::Roaring& bitmap) {
                 for (uint32_t val : remove_data) {
-                    roaring_tree.remove(val);
+                    bitmap.remove(val);
                 }
-                ankerl::nanobench::doNotOptimizeAway(&roaring_tree);
+                ankerl::nanobench::doNotOptimizeAway(&bitmap);
             },
             [&]() { return roaring_tree.getSizeInBytes(true); });
-        ankerl::nanobench::render(benchmark_json_template(), roaring_bench, g_output);
+        record_result(std::move(roaring_bench));
     }
 }
 
 void bench_macro_iteration() {
-    std::vector<double> densities = {0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99};
-    
-    for (double density : densities) {
-        const uint32_t UNIVERSE_SIZE = 1000000;
+    for (double density : DENSITIES) {
+        const std::string density_tag = std::to_string(static_cast<int>(density * 100));
         const uint32_t ELEMENT_COUNT = static_cast<uint32_t>(UNIVERSE_SIZE * density);
         
-        auto test_data = generate_random_values(ELEMENT_COUNT, UNIVERSE_SIZE);
+        const auto& test_data = unique_fixture(ELEMENT_COUNT);
 
         VebTree veb_tree;
-        for (uint32_t val : test_data) {
-            veb_tree.insert(val);
-        }
+        veb_tree.insert_many(test_data);
         
         std::vector<bool> vec_bool(UNIVERSE_SIZE);
         for (uint32_t val : test_data) {
@@ -397,12 +283,10 @@ void bench_macro_iteration() {
         }
         
         roaring::Roaring roaring_tree;
-        for (uint32_t val : test_data) {
-            roaring_tree.add(val);
-        }
+        roaring_tree.addMany(test_data.size(), test_data.data());
 
         auto veb_bench = run_macro_benchmark(
-            "veb_iteration_" + std::to_string(static_cast<int>(density * 100)),
+            "veb_iteration_" + density_tag,
             "vebitset",
             "iteration",
             density,
@@ -415,10 +299,10 @@ void bench_macro_iteration() {
                 ankerl::nanobench::doNotOptimizeAway(sum);
             },
             [&]() { return veb_tree.get_allocated_bytes(); });
-        ankerl::nanobench::render(benchmark_json_template(), veb_bench, g_output);
+        record_result(std::move(veb_bench));
 
         auto roaring_bench = run_macro_benchmark(
-            "roaring_iteration_" + std::to_string(static_cast<int>(density * 100)),
+            "roaring_iteration_" + density_tag,
             "roaring",
             "iteration",
             density,
@@ -431,38 +315,28 @@ void bench_macro_iteration() {
                 ankerl::nanobench::doNotOptimizeAway(sum);
             },
             [&]() { return roaring_tree.getSizeInBytes(true); });
-        ankerl::nanobench::render(benchmark_json_template(), roaring_bench, g_output);
+        record_result(std::move(roaring_bench));
     }
 }
 
 void bench_macro_set_operations() {
-    std::vector<double> densities = {0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99};
-    
-    for (double density : densities) {
-        const uint32_t UNIVERSE_SIZE = 1000000;
+    for (double density : DENSITIES) {
+        const std::string density_tag = std::to_string(static_cast<int>(density * 100));
         const uint32_t SET_SIZE = static_cast<uint32_t>(UNIVERSE_SIZE * density);
         
-        auto data1 = generate_random_values(SET_SIZE, UNIVERSE_SIZE);
-        auto data2 = generate_random_values(SET_SIZE, UNIVERSE_SIZE);
+        const auto& data1 = unique_fixture(SET_SIZE);
+        auto data2 = generate_unique_values(SET_SIZE, UNIVERSE_SIZE);
 
         VebTree veb_tree1, veb_tree2, veb_result_tree;
-        for (uint32_t val : data1) {
-            veb_tree1.insert(val);
-        }
-        for (uint32_t val : data2) {
-            veb_tree2.insert(val);
-        }
+        veb_tree1.insert_many(data1);
+        veb_tree2.insert_many(data2);
         
         roaring::Roaring roaring_tree1, roaring_tree2, roaring_result_tree;
-        for (uint32_t val : data1) {
-            roaring_tree1.add(val);
-        }
-        for (uint32_t val : data2) {
-            roaring_tree2.add(val);
-        }
+        roaring_tree1.addMany(data1.size(), data1.data());
+        roaring_tree2.addMany(data2.size(), data2.data());
 
         auto veb_union_bench = run_macro_benchmark(
-            "veb_union_" + std::to_string(static_cast<int>(density * 100)),
+            "veb_union_" + density_tag,
             "vebitset",
             "union",
             density,
@@ -472,10 +346,10 @@ void bench_macro_set_operations() {
                 ankerl::nanobench::doNotOptimizeAway(&veb_result_tree);
             },
             [&]() { return veb_result_tree.get_allocated_bytes(); });
-        ankerl::nanobench::render(benchmark_json_template(), veb_union_bench, g_output);
+        record_result(std::move(veb_union_bench));
 
         auto veb_intersection_bench = run_macro_benchmark(
-            "veb_intersection_" + std::to_string(static_cast<int>(density * 100)),
+            "veb_intersection_" + density_tag,
             "vebitset",
             "intersection",
             density,
@@ -485,10 +359,10 @@ void bench_macro_set_operations() {
                 ankerl::nanobench::doNotOptimizeAway(&veb_result_tree);
             },
             [&]() { return veb_result_tree.get_allocated_bytes(); });
-        ankerl::nanobench::render(benchmark_json_template(), veb_intersection_bench, g_output);
+        record_result(std::move(veb_intersection_bench));
 
         auto veb_xor_bench = run_macro_benchmark(
-            "veb_xor_" + std::to_string(static_cast<int>(density * 100)),
+            "veb_xor_" + density_tag,
             "vebitset",
             "xor",
             density,
@@ -498,10 +372,10 @@ void bench_macro_set_operations() {
                 ankerl::nanobench::doNotOptimizeAway(&veb_result_tree);
             },
             [&]() { return veb_result_tree.get_allocated_bytes(); });
-        ankerl::nanobench::render(benchmark_json_template(), veb_xor_bench, g_output);
+        record_result(std::move(veb_xor_bench));
 
         auto roaring_union_bench = run_macro_benchmark(
-            "roaring_union_" + std::to_string(static_cast<int>(density * 100)),
+            "roaring_union_" + density_tag,
             "roaring",
             "union",
             density,
@@ -511,10 +385,10 @@ void bench_macro_set_operations() {
                 ankerl::nanobench::doNotOptimizeAway(&roaring_result_tree);
             },
             [&]() { return roaring_result_tree.getSizeInBytes(true); });
-        ankerl::nanobench::render(benchmark_json_template(), roaring_union_bench, g_output);
+        record_result(std::move(roaring_union_bench));
 
         auto roaring_intersection_bench = run_macro_benchmark(
-            "roaring_intersection_" + std::to_string(static_cast<int>(density * 100)),
+            "roaring_intersection_" + density_tag,
             "roaring",
             "intersection",
             density,
@@ -525,10 +399,10 @@ void bench_macro_set_operations() {
             },
             [&]() { return roaring_result_tree.getSizeInBytes(true); });
 
-        ankerl::nanobench::render(benchmark_json_template(), roaring_intersection_bench, g_output);
+        record_result(std::move(roaring_intersection_bench));
 
         auto roaring_xor_bench = run_macro_benchmark(
-            "roaring_xor_" + std::to_string(static_cast<int>(density * 100)),
+            "roaring_xor_" + density_tag,
             "roaring",
             "xor",
             density,
@@ -538,6 +412,6 @@ void bench_macro_set_operations() {
                 ankerl::nanobench::doNotOptimizeAway(&roaring_result_tree);
             },
             [&]() { return roaring_result_tree.getSizeInBytes(true); });
-        ankerl::nanobench::render(benchmark_json_template(), roaring_xor_bench, g_output);
+        record_result(std::move(roaring_xor_bench));
     }
 }
@@ -73,6 +73,7 @@ int main(int argc, char* argv[]) {
         bench_macro_set_operations();
     }
 
+    render_results(g_output);
     g_output << "\n]\n";
     g_output.close();
     
@@ -12,7 +12,7 @@ void bench_roaring_micro() {
 
     {
         roaring::Roaring rb;
-        ankerl::nanobench::Bench().minEpochIterations(1000).run("Roaring Insert (sparse)", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(1000).run("Roaring Insert (sparse)", [&]() {
             uint32_t val = rng.bounded(LARGE_UNIVERSE);
             rb.add(val);
             ankerl::nanobench::doNotOptimizeAway(&rb);
@@ -22,7 +22,7 @@ void bench_roaring_micro() {
     {
         roaring::Roaring rb;
         uint32_t counter = 0;
-        ankerl::nanobench::Bench().minEpochIterations(1000).run("Roaring Insert (sequential)", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(1000).run("Roaring Insert (sequential)", [&]() {
             uint32_t val = (counter++ % LARGE_UNIVERSE);
             rb.add(val);
             ankerl::nanobench::doNotOptimizeAway(&rb);
@@ -32,7 +32,7 @@ void bench_roaring_micro() {
     {
         roaring::Roaring rb;
         uint32_t counter = 0;
-        ankerl::nanobench::Bench().minEpochIterations(1000).run("Roaring Insert (small universe)", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(1000).run("Roaring Insert (small universe)", [&]() {
             uint32_t val = (counter++ % SMALL_UNIVERSE);
             rb.add(val);
             ankerl::nanobench::doNotOptimizeAway(&rb);
@@ -44,7 +44,7 @@ void bench_roaring_micro() {
         for (uint32_t i = 0; i < 10000; ++i) {
             rb.add(rng.bounded(LARGE_UNIVERSE));
         }
-        ankerl::nanobench::Bench().minEpochIterations(10000).run("Roaring Contains", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(10000).run("Roaring Contains", [&]() {
             uint32_t val = rng.bounded(LARGE_UNIVERSE);
             ankerl::nanobench::doNotOptimizeAway(rb.contains(val));
         });
@@ -57,7 +57,7 @@ void bench_roaring_micro() {
         }
         auto values_to_delete = generate_random_values(5000, LARGE_UNIVERSE);
         uint32_t idx = 0;
-        ankerl::nanobench::Bench().minEpochIterations(1000).run("Roaring Remove", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(1000).run("Roaring Remove", [&]() {
             uint32_t val = values_to_delete[idx++ % values_to_delete.size()];
             rb.remove(val);
             ankerl::nanobench::doNotOptimizeAway(&rb);
@@ -69,7 +69,7 @@ void bench_roaring_micro() {
         for (uint32_t i = 0; i < 10000; ++i) {
             rb.add(rng.bounded(LARGE_UNIVERSE));
         }
-        ankerl::nanobench::Bench().minEpochIterations(100000).run("Roaring Min", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(100000).run("Roaring Min", [&]() {
             ankerl::nanobench::doNotOptimizeAway(rb.minimum());
         });
     }
@@ -79,7 +79,7 @@ void bench_roaring_micro() {
         for (uint32_t i = 0; i < 10000; ++i) {
             rb.add(rng.bounded(LARGE_UNIVERSE));
         }
-        ankerl::nanobench::Bench().minEpochIterations(100000).run("Roaring Max", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(100000).run("Roaring Max", [&]() {
             ankerl::nanobench::doNotOptimizeAway(rb.maximum());
         });
     }
@@ -89,7 +89,7 @@ void bench_roaring_micro() {
         for (uint32_t i = 0; i < 10000; ++i) {
             rb.add(rng.bounded(LARGE_UNIVERSE));
         }
-        ankerl::nanobench::Bench().minEpochIterations(10000).run("Roaring Count", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(10000).run("Roaring Count", [&]() {
             ankerl::nanobench::doNotOptimizeAway(rb.cardinality());
         });
     }
@@ -99,7 +99,7 @@ void bench_roaring_micro() {
         for (uint32_t i = 0; i < 5000; ++i) {
             rb.add(rng.bounded(LARGE_UNIVERSE));
         }
-        ankerl::nanobench::Bench().minEpochIterations(100).run("Roaring Iteration (5K elements)", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(100).run("Roaring Iteration (5K elements)", [&]() {
             uint32_t count = 0;
             for (auto _ : rb) {
                 count++;
@@ -113,7 +113,7 @@ void bench_roaring_micro() {
         for (uint32_t i = 0; i < 100000; ++i) {
             rb.add(rng.bounded(LARGE_UNIVERSE));
         }
-        ankerl::nanobench::Bench().minEpochIterations(10).run("Roaring Iteration (100K elements)", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(10).run("Roaring Iteration (100K elements)", [&]() {
             uint32_t count = 0;
             for (auto _ : rb) {
                 count++;
@@ -128,7 +128,7 @@ void bench_roaring_micro() {
             rb1.add(rng.bounded(LARGE_UNIVERSE));
             rb2.add(rng.bounded(LARGE_UNIVERSE));
         }
-        ankerl::nanobench::Bench().minEpochIterations(100).run("Roaring Union", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(100).run("Roaring Union", [&]() {
             ankerl::nanobench::doNotOptimizeAway(rb1 |= rb2);
         });
     }
@@ -139,7 +139,7 @@ void bench_roaring_micro() {
             rb1.add(rng.bounded(LARGE_UNIVERSE));
             rb2.add(rng.bounded(LARGE_UNIVERSE));
         }
-        ankerl::nanobench::Bench().minEpochIterations(100).run("Roaring Intersection", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(100).run("Roaring Intersection", [&]() {
             ankerl::nanobench::doNotOptimizeAway(rb1 &= rb2);
         });
     }
@@ -150,7 +150,7 @@ void bench_roaring_micro() {
             rb1.add(rng.bounded(LARGE_UNIVERSE));
             rb2.add(rng.bounded(LARGE_UNIVERSE));
         }
-        ankerl::nanobench::Bench().minEpochIterations(100).run("Roaring XOR", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(100).run("Roaring XOR", [&]() {
             ankerl::nanobench::doNotOptimizeAway(rb1 ^= rb2);
         });
     }
@@ -12,7 +12,7 @@ void bench_veb_micro() {
 
     {
         VebTree tree;
-        ankerl::nanobench::Bench().minEpochIterations(1000).run("VEB Insert (sparse)", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(1000).run("VEB Insert (sparse)", [&]() {
             tree.insert(rng.bounded(LARGE_UNIVERSE));
             ankerl::nanobench::doNotOptimizeAway(&tree);
         });
@@ -21,7 +21,7 @@ void bench_veb_micro() {
     {
         VebTree tree;
         uint32_t counter = 0;
-        ankerl::nanobench::Bench().minEpochIterations(1000).run("VEB Insert (sequential)", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(1000).run("VEB Insert (sequential)", [&]() {
             tree.insert(counter++ % LARGE_UNIVERSE);
             ankerl::nanobench::doNotOptimizeAway(&tree);
         });
@@ -30,7 +30,7 @@ void bench_veb_micro() {
     {
         VebTree tree;
         uint32_t counter = 0;
-        ankerl::nanobench::Bench().minEpochIterations(1000).run("VEB Insert (small universe)", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(1000).run("VEB Insert (small universe)", [&]() {
             tree.insert(counter++ % SMALL_UNIVERSE);
             ankerl::nanobench::doNotOptimizeAway(&tree);
         });
@@ -41,7 +41,7 @@ void bench_veb_micro() {
         for (uint32_t i = 0; i < 10000; ++i) {
             tree.insert(rng.bounded(LARGE_UNIVERSE));
         }
-        ankerl::nanobench::Bench().minEpochIterations(10000).run("VEB Contains", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(10000).run("VEB Contains", [&]() {
             ankerl::nanobench::doNotOptimizeAway(tree.contains(rng.bounded(LARGE_UNIVERSE)));
         });
     }
@@ -53,7 +53,7 @@ void bench_veb_micro() {
         }
         auto values_to_delete = generate_random_values(5000, LARGE_UNIVERSE);
         uint32_t idx = 0;
-        ankerl::nanobench::Bench().minEpochIterations(1000).run("VEB Remove", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(1000).run("VEB Remove", [&]() {
             tree.remove(values_to_delete[idx++ % values_to_delete.size()]);
             ankerl::nanobench::doNotOptimizeAway(&tree);
         });
@@ -64,7 +64,7 @@ void bench_veb_micro() {
         for (uint32_t i = 0; i < 10000; ++i) {
             tree.insert(rng.bounded(LARGE_UNIVERSE));
         }
-        ankerl::nanobench::Bench().minEpochIterations(100000).run("VEB Min", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(100000).run("VEB Min", [&]() {
             ankerl::nanobench::doNotOptimizeAway(tree.min());
         });
     }
@@ -74,7 +74,7 @@ void bench_veb_micro() {
         for (uint32_t i = 0; i < 10000; ++i) {
             tree.insert(rng.bounded(LARGE_UNIVERSE));
         }
-        ankerl::nanobench::Bench().minEpochIterations(100000).run("VEB Max", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(100000).run("VEB Max", [&]() {
             ankerl::nanobench::doNotOptimizeAway(tree.max());
         });
     }
@@ -84,7 +84,7 @@ void bench_veb_micro() {
         for (uint32_t i = 0; i < 10000; ++i) {
             tree.insert(rng.bounded(LARGE_UNIVERSE));
         }
-        ankerl::nanobench::Bench().minEpochIterations(10000).run("VEB Size", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(10000).run("VEB Size", [&]() {
             ankerl::nanobench::doNotOptimizeAway(tree.size());
         });
     }
@@ -94,7 +94,7 @@ void bench_veb_micro() {
         for (uint32_t i = 0; i < 10000; ++i) {
             tree.insert(rng.bounded(LARGE_UNIVERSE));
         }
-        ankerl::nanobench::Bench().minEpochIterations(1000).run("VEB Successor", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(1000).run("VEB Successor", [&]() {
             ankerl::nanobench::doNotOptimizeAway(tree.successor(rng.bounded(LARGE_UNIVERSE)));
         });
     }
@@ -104,7 +104,7 @@ void bench_veb_micro() {
         for (uint32_t i = 0; i < 10000; ++i) {
             tree.insert(rng.bounded(LARGE_UNIVERSE));
         }
-        ankerl::nanobench::Bench().minEpochIterations(1000).run("VEB Predecessor", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(1000).run("VEB Predecessor", [&]() {
             ankerl::nanobench::doNotOptimizeAway(tree.predecessor(rng.bounded(LARGE_UNIVERSE)));
         });
     }
@@ -114,7 +114,7 @@ void bench_veb_micro() {
         for (uint32_t i = 0; i < 5000; ++i) {
             tree.insert(rng.bounded(LARGE_UNIVERSE));
         }
-        ankerl::nanobench::Bench().minEpochIterations(100).run("VEB Iteration (5K elements)", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(100).run("VEB Iteration (5K elements)", [&]() {
             uint32_t count = 0;
             for (auto _ : tree) {
                 count++;
@@ -128,7 +128,7 @@ void bench_veb_micro() {
         for (uint32_t i = 0; i < 100000; ++i) {
             tree.insert(rng.bounded(LARGE_UNIVERSE));
         }
-        ankerl::nanobench::Bench().minEpochIterations(10).run("VEB Iteration (100K elements)", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(10).run("VEB Iteration (100K elements)", [&]() {
             uint32_t count = 0;
             for (auto _ : tree) {
                 count++;
@@ -143,7 +143,7 @@ void bench_veb_micro() {
             tree1.insert(rng.bounded(LARGE_UNIVERSE));
             tree2.insert(rng.bounded(LARGE_UNIVERSE));
         }
-        ankerl::nanobench::Bench().minEpochIterations(100).run("VEB Union", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(100).run("VEB Union", [&]() {
             ankerl::nanobench::doNotOptimizeAway(tree1 |= tree2);
         });
     }
@@ -154,7 +154,7 @@ void bench_veb_micro() {
             tree1.insert(rng.bounded(LARGE_UNIVERSE));
             tree2.insert(rng.bounded(LARGE_UNIVERSE));
         }
-        ankerl::nanobench::Bench().minEpochIterations(100).run("VEB Intersection", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(100).run("VEB Intersection", [&]() {
             ankerl::nanobench::doNotOptimizeAway(tree1 &= tree2);
         });
     }
@@ -165,7 +165,7 @@ void bench_veb_micro() {
             tree1.insert(rng.bounded(LARGE_UNIVERSE));
             tree2.insert(rng.bounded(LARGE_UNIVERSE));
         }
-        ankerl::nanobench::Bench().minEpochIterations(100).run("VEB XOR", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(100).run("VEB XOR", [&]() {
             ankerl::nanobench::doNotOptimizeAway(tree1 ^= tree2);
         });
     }
@@ -13,7 +13,7 @@ void bench_vector_bool_micro() {
 
     {
         std::vector<bool> vb(LARGE_UNIVERSE, false);
-        ankerl::nanobench::Bench().minEpochIterations(1000).run("vector<bool> Insert (random)", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(1000).run("vector<bool> Insert (random)", [&]() {
             uint32_t idx = rng.bounded(LARGE_UNIVERSE);
             vb[idx] = true;
             ankerl::nanobench::doNotOptimizeAway(&vb);
@@ -23,7 +23,7 @@ void bench_vector_bool_micro() {
     {
         std::vector<bool> vb(SMALL_UNIVERSE, false);
         uint32_t counter = 0;
-        ankerl::nanobench::Bench().minEpochIterations(1000).run("vector<bool> Insert (sequential, small)", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(1000).run("vector<bool> Insert (sequential, small)", [&]() {
             uint32_t idx = counter++ % SMALL_UNIVERSE;
             vb[idx] = true;
             ankerl::nanobench::doNotOptimizeAway(&vb);
@@ -35,7 +35,7 @@ void bench_vector_bool_micro() {
         for (uint32_t i = 0; i < 10000; ++i) {
             vb[rng.bounded(LARGE_UNIVERSE)] = true;
         }
-        ankerl::nanobench::Bench().minEpochIterations(10000).run("vector<bool> Contains", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(10000).run("vector<bool> Contains", [&]() {
             uint32_t idx = rng.bounded(LARGE_UNIVERSE);
             ankerl::nanobench::doNotOptimizeAway(vb[idx]);
         });
@@ -46,7 +46,7 @@ void bench_vector_bool_micro() {
         for (uint32_t i = 0; i < 10000; ++i) {
             vb[rng.bounded(LARGE_UNIVERSE)] = true;
         }
-        ankerl::nanobench::Bench().minEpochIterations(1000).run("vector<bool> Erase (random)", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(1000).run("vector<bool> Erase (random)", [&]() {
             uint32_t idx = rng.bounded(LARGE_UNIVERSE);
             vb[idx] = false;
             ankerl::nanobench::doNotOptimizeAway(&vb);
@@ -58,7 +58,7 @@ void bench_vector_bool_micro() {
         for (uint32_t i = 0; i < 10000; ++i) {
             vb[rng.bounded(LARGE_UNIVERSE)] = true;
         }
-        ankerl::nanobench::Bench().minEpochIterations(10).run("vector<bool> Count", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(10).run("vector<bool> Count", [&]() {
             uint32_t count = 0;
             for (bool b : vb) {
                 count += b ? 1 : 0;
@@ -72,7 +72,7 @@ void bench_vector_bool_micro() {
         for (uint32_t i = 0; i < 10000; ++i) {
             vb[rng.bounded(LARGE_UNIVERSE)] = true;
         }
-        ankerl::nanobench::Bench().minEpochIterations(100).run("vector<bool> Min", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(100).run("vector<bool> Min", [&]() {
             auto it = std::find(vb.begin(), vb.end(), true);
             uint32_t idx = (it != vb.end()) ? static_cast<uint32_t>(std::distance(vb.begin(), it)) : UINT32_MAX;
             ankerl::nanobench::doNotOptimizeAway(idx);
@@ -84,7 +84,7 @@ void bench_vector_bool_micro() {
         for (uint32_t i = 0; i < 10000; ++i) {
             vb[rng.bounded(LARGE_UNIVERSE)] = true;
         }
-        ankerl::nanobench::Bench().minEpochIterations(100).run("vector<bool> Max", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(100).run("vector<bool> Max", [&]() {
             auto it = std::find(vb.rbegin(), vb.rend(), true);
             uint32_t idx = (it != vb.rend()) ? static_cast<uint32_t>(std::distance(vb.begin(), it.base()) - 1) : UINT32_MAX;
             ankerl::nanobench::doNotOptimizeAway(idx);
@@ -96,7 +96,7 @@ void bench_vector_bool_micro() {
         for (uint32_t i = 0; i < 5000; ++i) {
             vb[rng.bounded(LARGE_UNIVERSE)] = true;
         }
-        ankerl::nanobench::Bench().minEpochIterations(100).run("vector<bool> Iteration (5K elements)", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(100).run("vector<bool> Iteration (5K elements)", [&]() {
             uint32_t count = 0;
             for (uint32_t i = 0; i < vb.size(); ++i) {
                 if (vb[i]) count++;
@@ -110,7 +110,7 @@ void bench_vector_bool_micro() {
         for (uint32_t i = 0; i < 100000; ++i) {
             vb[rng.bounded(LARGE_UNIVERSE)] = true;
         }
-        ankerl::nanobench::Bench().minEpochIterations(10).run("vector<bool> Iteration (100K elements)", [&]() {
+        ankerl::nanobench::Bench().warmup(100).minEpochIterations(10).run("vector<bool> Iteration (100K elements)", [&]() {
             uint32_t count = 0;
             for (uint32_t i = 0; i < vb.size(); ++i) {
                 if (vb[i]) count++;
@@ -1,19 +1,36 @@
 #pragma once
 
 #include <nanobench.h>
+#include <algorithm>
 #include <chrono>
 #include <string>
+#include <utility>
 #include <vector>
 #include <iomanip>
 #include <fstream>
 #include <sstream>
 
 inline std::vector<uint32_t> generate_random_values(uint32_t count, uint32_t max_value) {
+    ankerl::nanobench::Rng rng;
+    std::vector<uint32_t> values(count);
+    for (auto& value : values) {
+        value = rng.bounded(max_value);
+    }
+    return values;
+}
+
+// Draws `count` distinct values from [0, max_value) in a single selection-sampling pass,
+// then shuffles them so insertion order stays random.
+inline std::vector<uint32_t> generate_unique_values(uint32_t count, uint32_t max_value) {
+    ankerl::nanobench::Rng rng;
     std::vector<uint32_t> values;
     values.reserve(count);
-    for (uint32_t i = 0; i < count; ++i) {
-        values.push_back(ankerl::nanobench::Rng{}.bounded(max_value));
+    for (uint32_t i = 0; i < max_value && values.size() < count; ++i) {
+        if (rng.bounded(max_value - i) < count - values.size()) {
+            values.push_back(i);
+        }
     }
+    std::ranges::shuffle(values, rng);
     return values;
 }
 
@@ -48,8 +65,56 @@ ankerl::nanobench::Bench run_macro_benchmark(
         .context("scenario", scenario)
         .context("density", std::to_string(density))
         .context("operations", std::to_string(element_count))
+        .warmup(1)
         .minEpochIterations(10)
         .epochs(5)
         .output(nullptr)
         .run(name, benchmark_fn);
 }
+
+// For scenarios that consume the structure they run on (e.g. remove), every timed iteration
+// gets its own copy of `initial`. The copies are made before timing starts and destroyed after
+// it ends. There is no warmup, because a warmup iteration would consume the state the first
+// measured one relies on.
+template <typename State, typename Fn1, typename Fn2>
+ankerl::nanobench::Bench run_consuming_macro_benchmark(
+    const std::string& name,
+    const std::string& library,
+    const std::string& scenario,
+    double density,
+    uint64_t element_count,
+    const State& initial,
+    Fn1&& benchmark_fn,
+    [[maybe_unused]] Fn2&& memory_fn) {
+    constexpr size_t EPOCHS = 11;
+    std::vector<State> states(EPOCHS, initial);
+    size_t next = 0;
+    return ankerl::nanobench::Bench()
+        .name(name)
+        .context("library", library)
+        .context("scenario", scenario)
+        .context("density", std::to_string(density))
+        .context("operations", std::to_string(element_count))
+        .epochIterations(1)
+        .epochs(EPOCHS)
+        .output(nullptr)
+        .run(name, [&]() { benchmark_fn(states.at(next++)); });
+}
+
+// Finished benchmarks are held here and rendered once all measurements are done,
+// so report formatting and file writes never run between timed benchmarks.
+inline std::vector<ankerl::nanobench::Bench>& pending_results() {
+    static std::vector<ankerl::nanobench::Bench> results;
+    return results;
+}
+
+inline void record_result(ankerl::nanobench::Bench bench) {
+    pending_results().push_back(std::move(bench));
+}
+
+inline void render_results(std::ostream& out) {
+    for (const auto& bench : pending_results()) {
+        ankerl::nanobench::render(benchmark_json_template(), bench, out);
+    }
+    pending_results().clear();
+}
@@ -2,6 +2,10 @@
 #include "doctest.h"
 
 #include "VEB/VebTree.hpp"
+#include <algorithm>
+#include <ranges>
+#include <utility>
+#include <vector>
 
 TEST_SUITE("VebTree Basics") {
     TEST_CASE("create empty tree") {
@@ -38,6 +42,80 @@ TEST_SUITE("VebTree Basics") {
         REQUIRE(tree.size() == 1);
     }
 
+    TEST_CASE("insert many elements") {
+        VebTree tree;
+        const std::vector<size_t> values{300, 5, 70000, 5, 255, 1ull << 33};
+        tree.insert_many(values);
+        REQUIRE(tree.size() == 5);
+        for (size_t v : values) {
+            REQUIRE(tree.contains(v));
+        }
+        REQUIRE(tree.min() == 5);
+        REQUIRE(tree.max() == 1ull << 33);
+    }
+
+    TEST_CASE("insert many matches individual inserts") {
+        VebTree bulk;
+        VebTree single;
+        const auto values{std::views::iota(0uz, 5000uz)
+            | std::views::transform([](size_t i) { return (i * 7919) % 100000; })};
+        bulk.insert(42);
+        single.insert(42);
+        bulk.insert_many(values);
+        for (size_t v : values) {
+            single.insert(v);
+        }
+        REQUIRE(bulk == single);
+
+        bulk.insert_many(std::vector<size_t>{});
+        REQUIRE(bulk == single);
+    }
+
+    TEST_CASE("insert range") {
+        VebTree tree;
+        tree.insert(7);
+        tree.insert_range(200, 70000);
+        REQUIRE(tree.size() == 69802);
+        REQUIRE(tree.min() == 7);
+        REQUIRE(tree.max() == 70000);
+        REQUIRE(!tree.contains(199));
+        REQUIRE(tree.count_range(200, 70000) == 69801);
+
+        tree.insert_range(300, 400);
+        REQUIRE(tree.size() == 69802);
+
+        tree.insert_range(5, 4);
+        REQUIRE(tree.size() == 69802);
+    }
+
+    TEST_CASE("insert range single element") {
+        VebTree tree;
+        tree.insert_range(1ull << 33, 1ull << 33);
+        REQUIRE(tree.size() == 1);
+        REQUIRE(tree.contains(1ull << 33));
+    }
+
+    TEST_CASE("insert range matches single inserts") {
+        const std::vector<std::pair<std::size_t, std::size_t>> ranges{
+            {0, 255}, {1, 254}, {3, 1000}, {255, 65536}, {256, 131071},
+            {65000, 300000}, {1 << 20, (1 << 20) + 70000}, {(1ull << 32) - 300, (1ull << 32) + 65536},
+        };
+        for (const auto& [start, end] : ranges) {
+            VebTree expected;
+            VebTree tree;
+            for (const auto x : {7uz, 600uz, 70000uz, 140000uz}) {
+                expected.insert(x);
+                tree.insert(x);
+            }
+            for (auto x{start}; x <= end; ++x) {
+                expected.insert(x);
+            }
+            tree.insert_range(start, end);
+            REQUIRE(tree.size() == expected.size());
+            REQUIRE(tree.to_vector() == expected.to_vector());
+        }
+    }
+
     TEST_CASE("remove element") {
         VebTree tree;
         tree.insert(10);
@@ -56,6 +134,24 @@ TEST_SUITE("VebTree Basics") {
         REQUIRE(tree.contains(10));
     }
 
+    TEST_CASE("remove nonexistent element between min and max") {
+        VebTree tree;
+        tree.insert(10);
+        tree.insert(600);
+        tree.remove(300);
+        REQUIRE(tree.size() == 2);
+        REQUIRE(tree.to_vector() == std::vector<size_t>{10, 600});
+    }
+
+    TEST_CASE("remove many skips absent elements between min and max") {
+        VebTree tree;
+        tree.insert(10);
+        tree.insert(600);
+        tree.remove_many(std::vector<size_t>{300, 10});
+        REQUIRE(tree.size() == 1);
+        REQUIRE(tree.to_vector() == std::vector<size_t>{600});
+    }
+
     TEST_CASE("remove all elements") {
         VebTree tree;
         tree.insert(1);
@@ -69,6 +165,36 @@ TEST_SUITE("VebTree Basics") {
         REQUIRE(tree.size() == 0);
     }
 
+    TEST_CASE("remove many elements") {
+        VebTree tree;
+        for (size_t i = 0; i < 1000; ++i) {
+            tree.insert(i * 97);
+        }
+        std::vector<size_t> to_remove;
+        for (size_t i = 0; i < 1000; i += 2) {
+            to_remove.push_back(i * 97);
+        }
+        to_remove.push_back(5);
+        to_remove.push_back(1ull << 40);
+        tree.remove_many(to_remove);
+        REQUIRE(tree.size() == 500);
+        for (size_t i = 0; i < 1000; ++i) {
+            REQUIRE(tree.contains(i * 97) == (i % 2 == 1));
+        }
+    }
+
+    TEST_CASE("remove many until empty") {
+        VebTree tree;
+        const std::vector<size_t> values{3, 300, 70000};
+        tree.insert_many(values);
+        tree.remove_many(std::vector<size_t>{70000, 3, 300, 300});
+        REQUIRE(tree.empty());
+        REQUIRE(tree.size() == 0);
+
+        tree.remove_many(values);
+        REQUIRE(tree.empty());
+    }
+
     TEST_CASE("clear all elements") {
         VebTree tree;
         tree.insert(1);
@@ -140,4 +266,21 @@ TEST_SUITE("VebTree Basics") {
         REQUIRE(tree2.contains(20));
         REQUIRE(!tree2.contains(100));
     }
+
+    TEST_CASE("for_each matches iteration order") {
+        for (const auto top : {200uz, 1000uz, 200000uz, 1uz << 40}) {
+            VebTree tree;
+            tree.insert_range(0, std::min(top, 1023uz));
+            if (top > 2 * 65536) {
+                tree.insert_range(65536, 2 * 65536 - 1);
+            }
+            tree.remove(top / 3);
+            tree.insert(top);
+
+            std::vector<std::size_t> visited;
+            tree.for_each([&](std::size_t x) { visited.push_back(x); });
+            REQUIRE(visited == std::vector<std::size_t>(tree.begin(), tree.end()));
+            REQUIRE(tree.to_vector() == visited);
+        }
+    }
 }
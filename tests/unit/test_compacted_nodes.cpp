@@ -1,92 +1,128 @@
 #include "doctest.h"
 #include "VEB/VebTree.hpp"
-#include <set>
 #include <algorithm>
+#include <array>
+#include <iterator>
+#include <vector>
+
+static constexpr size_t BASE_A16{1 * 256};
+static constexpr size_t BASE_B16{3 * 256};
+static constexpr size_t BASE_C16{5 * 256};
+
+static constexpr size_t N32{65536};
+static constexpr size_t BASE_A32{1 * N32};
+static constexpr size_t BASE_B32{3 * N32};
+static constexpr size_t BASE_C32{5 * N32};
+
+// {0, 1000} plus a fully populated Node16 cluster [256, 511], built once and copied per test
+static const VebTree& full_cluster16() {
+    static const VebTree tree{[] {
+        VebTree t;
+        t.insert_many(std::array<size_t, 2>{0, 1000});
+        t.insert_range(256, 511);
+        return t;
+    }()};
+    return tree;
+}
+
+// {0, 1000000} plus a fully populated Node32 cluster [65536, 131071], built once and copied per test
+static const VebTree& full_cluster32() {
+    static const VebTree tree{[] {
+        VebTree t;
+        t.insert_many(std::array<size_t, 2>{0, 1000000});
+        t.insert_range(N32, 2 * N32 - 1);
+        return t;
+    }()};
+    return tree;
+}
+
+// {BASE_A16, BASE_C16} plus a fully populated cluster at BASE_B16, built once and shared read-only
+static const VebTree& compacted_source16() {
+    static const VebTree tree{[] {
+        VebTree t;
+        t.insert_many(std::array<size_t, 2>{BASE_A16, BASE_C16});
+        t.insert_range(BASE_B16, BASE_B16 + 255);
+        return t;
+    }()};
+    return tree;
+}
+
+// {BASE_A32, BASE_C32} plus a fully populated cluster at BASE_B32, built once and shared read-only
+static const VebTree& compacted_source32() {
+    static const VebTree tree{[] {
+        VebTree t;
+        t.insert_many(std::array<size_t, 2>{BASE_A32, BASE_C32});
+        t.insert_range(BASE_B32, BASE_B32 + N32 - 1);
+        return t;
+    }()};
+    return tree;
+}
+
+// Sorted contents of `s1 | s2` in the Node16 OR desync case, built once
+static const std::vector<size_t>& or_desync_expected16() {
+    static const std::vector<size_t> expected{[] {
+        std::vector<size_t> v{0};
+        for (size_t i = 256; i < 512; ++i) {
+            v.push_back(i);
+        }
+        v.insert(v.end(), {532, 542, 10000});
+        return v;
+    }()};
+    return expected;
+}
 
 TEST_SUITE("Compacted Node Clustering Behavior (Node16/32 Set Operations)") {
     TEST_CASE("Node16 OR compaction: two half-clusters merge to implicit full cluster") {
         VebTree a, b;
         
-        size_t base_a = 1 * 256;
-        size_t base_b = 3 * 256;
-        size_t base_c = 5 * 256;
-        
-        a.insert(base_a);
-        for (size_t i = 0; i < 128; ++i) {
-            a.insert(base_b + i);
-        }
+        a.insert(BASE_A16);
+        a.insert_range(BASE_B16, BASE_B16 + 127);
         
-        b.insert(base_c);
-        for (size_t i = 128; i < 256; ++i) {
-            b.insert(base_b + i);
-        }
+        b.insert(BASE_C16);
+        b.insert_range(BASE_B16 + 128, BASE_B16 + 255);
         
         VebTree dest = a | b;
         
         REQUIRE(dest.size() == 258);
-        REQUIRE(dest.min().value() == base_a);
-        REQUIRE(dest.max().value() == base_c);
-        REQUIRE(dest.contains(base_b + 0));
-        REQUIRE(dest.contains(base_b + 127));
-        REQUIRE(dest.contains(base_b + 128));
-        REQUIRE(dest.contains(base_b + 255));
+        REQUIRE(dest.min().value() == BASE_A16);
+        REQUIRE(dest.max().value() == BASE_C16);
+        REQUIRE(dest.contains(BASE_B16 + 0));
+        REQUIRE(dest.contains(BASE_B16 + 127));
+        REQUIRE(dest.contains(BASE_B16 + 128));
+        REQUIRE(dest.contains(BASE_B16 + 255));
         
         std::vector<size_t> arr(dest.begin(), dest.end());
         REQUIRE(arr.size() == 258);
     }
 
     TEST_CASE("Node16 or with compacted source") {
-        VebTree src;
+        const VebTree& src{compacted_source16()};
         VebTree other;
         
-        size_t base_a = 1 * 256;
-        size_t base_b = 3 * 256;
-        size_t base_c = 5 * 256;
-        
-        src.insert(base_a);
-        src.insert(base_c);
-        for (size_t i = 0; i < 256; ++i) {
-            src.insert(base_b + i);
-        }
-        
-        other.insert(base_c + 1);
-        other.insert(base_b + 13);
-        other.insert(base_b + 37);
+        other.insert_many(std::array<size_t, 3>{BASE_C16 + 1, BASE_B16 + 13, BASE_B16 + 37});
         
         VebTree dest = src | other;
-        std::set<size_t> ref_src(src.begin(), src.end());
-        std::set<size_t> ref_other(other.begin(), other.end());
+        const auto ref_src{src.to_vector()};
+        const auto ref_other{other.to_vector()};
         
-        std::set<size_t> expected;
+        std::vector<size_t> expected;
         std::set_union(ref_src.begin(), ref_src.end(), ref_other.begin(), ref_other.end(),
-                      std::inserter(expected, expected.begin()));
+                      std::back_inserter(expected));
         
         REQUIRE(dest.size() == expected.size());
+        REQUIRE(dest.to_vector() == expected);
     }
 
     TEST_CASE("Node16 and with compacted source") {
-        VebTree src;
+        const VebTree& src{compacted_source16()};
         VebTree other;
         
-        size_t base_a = 1 * 256;
-        size_t base_b = 3 * 256;
-        size_t base_c = 5 * 256;
-        
-        src.insert(base_a);
-        src.insert(base_c);
-        src.insert(base_b);
-        for (size_t i = 1; i < 256; ++i) {
-            src.insert(base_b + i);
-        }
-        
-        other.insert(base_c + 1);
-        other.insert(base_b + 13);
-        other.insert(base_b + 37);
+        other.insert_many(std::array<size_t, 3>{BASE_C16 + 1, BASE_B16 + 13, BASE_B16 + 37});
         
         VebTree dest = src & other;
         
-        REQUIRE(dest.contains(base_b + 13));
-        REQUIRE(dest.contains(base_b + 37));
+        REQUIRE(dest.contains(BASE_B16 + 13));
+        REQUIRE(dest.contains(BASE_B16 + 37));
         REQUIRE(dest.size() == 2);
     }
 
@@ -94,27 +130,11 @@ TEST_SUITE("Compacted Node Clustering Behavior (Node16/32 Set Operations)") {
         VebTree a;
         VebTree b;
         
-        size_t base_a = 1 * 256;
-        size_t base_b = 3 * 256;
-        size_t base_c = 5 * 256;
-        
-        a.insert(base_a - 1);
-        a.insert(base_a);
-        a.insert(base_c - 1);
-        a.insert(base_c);
-        a.insert(base_b);
-        for (size_t i = 1; i < 256; ++i) {
-            a.insert(base_b + i);
-        }
+        a.insert_many(std::array<size_t, 4>{BASE_A16 - 1, BASE_A16, BASE_C16 - 1, BASE_C16});
+        a.insert_range(BASE_B16, BASE_B16 + 255);
         
-        b.insert(base_a);
-        b.insert(base_a + 1);
-        b.insert(base_c);
-        b.insert(base_c + 1);
-        b.insert(base_b);
-        for (size_t i = 1; i < 256; ++i) {
-            b.insert(base_b + i);
-        }
+        b.insert_many(std::array<size_t, 4>{BASE_A16, BASE_A16 + 1, BASE_C16, BASE_C16 + 1});
+        b.insert_range(BASE_B16, BASE_B16 + 255);
         
         VebTree dest = a & b;
         REQUIRE(dest.size() == 258);
@@ -124,17 +144,11 @@ TEST_SUITE("Compacted Node Clustering Behavior (Node16/32 Set Operations)") {
         VebTree s1;
         VebTree s2;
         
-        s1.insert(0);
-        s1.insert(1000);
-        for (size_t i = 0; i < 128; ++i) {
-            s1.insert(256 + i);
-        }
+        s1.insert_many(std::array<size_t, 2>{0, 1000});
+        s1.insert_range(256, 383);
         
-        s2.insert(0);
-        s2.insert(1000);
-        for (size_t i = 128; i < 256; ++i) {
-            s2.insert(256 + i);
-        }
+        s2.insert_many(std::array<size_t, 2>{0, 1000});
+        s2.insert_range(384, 511);
         
         VebTree dest = s1 | s2;
         
@@ -145,20 +159,10 @@ TEST_SUITE("Compacted Node Clustering Behavior (Node16/32 Set Operations)") {
     }
 
     TEST_CASE("Node16 and resident from nonresident") {
-        VebTree s1;
+        VebTree s1{full_cluster16()};
         VebTree s2;
         
-        s1.insert(0);
-        s1.insert(1000);
-        for (size_t i = 0; i < 256; ++i) {
-            s1.insert(256 + i);
-        }
-        
-        s2.insert(0);
-        s2.insert(1000);
-        s2.insert(256);
-        s2.insert(257);
-        s2.insert(258);
+        s2.insert_many(std::array<size_t, 5>{0, 1000, 256, 257, 258});
         
         VebTree dest = s1 & s2;
         
@@ -173,20 +177,11 @@ TEST_SUITE("Compacted Node Clustering Behavior (Node16/32 Set Operations)") {
     }
 
     TEST_CASE("Node16 xor resident from nonresident") {
-        VebTree s1;
+        VebTree s1{full_cluster16()};
         VebTree s2;
         
-        s1.insert(0);
-        s1.insert(1000);
-        for (size_t i = 0; i < 256; ++i) {
-            s1.insert(256 + i);
-        }
-        
-        s2.insert(0);
-        s2.insert(1000);
-        for (size_t i = 0; i < 10; ++i) {
-            s2.insert(256 + i);
-        }
+        s2.insert_many(std::array<size_t, 2>{0, 1000});
+        s2.insert_range(256, 265);
         
         VebTree dest = s1 ^ s2;
         
@@ -197,16 +192,10 @@ TEST_SUITE("Compacted Node Clustering Behavior (Node16/32 Set Operations)") {
         VebTree s1;
         VebTree s2;
         
-        s1.insert(0);
-        s1.insert(10000);
-        s1.insert(266);
-        s1.insert(532);
+        s1.insert_many(std::array<size_t, 4>{0, 10000, 266, 532});
         
-        s2.insert(0);
-        s2.insert(10000);
-        for (size_t i = 0; i < 256; ++i) {
-            s2.insert(256 + i);
-        }
+        s2.insert_many(std::array<size_t, 2>{0, 10000});
+        s2.insert_range(256, 511);
         s2.insert(542);
         
         VebTree dest = s1 | s2;
@@ -217,23 +206,14 @@ TEST_SUITE("Compacted Node Clustering Behavior (Node16/32 Set Operations)") {
         REQUIRE(dest.contains(266));
         REQUIRE(dest.min().value() == 0);
         REQUIRE(dest.max().value() == 10000);
+        REQUIRE(dest.to_vector() == or_desync_expected16());
     }
 
     TEST_CASE("Node16 xor full resident mix") {
-        VebTree s1;
+        VebTree s1{full_cluster16()};
         VebTree s2;
         
-        s1.insert(0);
-        s1.insert(1000);
-        for (size_t i = 0; i < 256; ++i) {
-            s1.insert(256 + i);
-        }
-        
-        s2.insert(0);
-        s2.insert(1000);
-        s2.insert(256);
-        s2.insert(257);
-        s2.insert(258);
+        s2.insert_many(std::array<size_t, 5>{0, 1000, 256, 257, 258});
         
         VebTree dest = s1 ^ s2;
         
@@ -244,20 +224,10 @@ TEST_SUITE("Compacted Node Clustering Behavior (Node16/32 Set Operations)") {
     }
 
     TEST_CASE("Node16 and full resident mix") {
-        VebTree s1;
+        VebTree s1{full_cluster16()};
         VebTree s2;
         
-        s1.insert(0);
-        s1.insert(1000);
-        for (size_t i = 0; i < 256; ++i) {
-            s1.insert(256 + i);
-        }
-        
-        s2.insert(0);
-        s2.insert(1000);
-        s2.insert(256);
-        s2.insert(257);
-        s2.insert(258);
+        s2.insert_many(std::array<size_t, 5>{0, 1000, 256, 257, 258});
         
         VebTree dest = s1 & s2;
         
@@ -267,20 +237,8 @@ TEST_SUITE("Compacted Node Clustering Behavior (Node16/32 Set Operations)") {
     }
 
     TEST_CASE("Node16 or two full clusters") {
-        VebTree s1;
-        VebTree s2;
-        
-        s1.insert(0);
-        s1.insert(1000);
-        for (size_t i = 0; i < 256; ++i) {
-            s1.insert(256 + i);
-        }
-        
-        s2.insert(0);
-        s2.insert(1000);
-        for (size_t i = 0; i < 256; ++i) {
-            s2.insert(256 + i);
-        }
+        VebTree s1{full_cluster16()};
+        VebTree s2{full_cluster16()};
         
         VebTree dest = s1 | s2;
         
@@ -291,220 +249,122 @@ TEST_SUITE("Compacted Node Clustering Behavior (Node16/32 Set Operations)") {
         VebTree key_full;
         VebTree key_partial;
         
-        size_t N = 65536;
-        size_t base_a = 1 * N;
-        size_t base_b = 3 * N;
-        size_t base_c = 5 * N;
-        
-        key_full.insert(base_a);
-        key_full.insert(base_c);
-        key_full.insert(base_b);
-        
-        for (size_t i = 1; i < N; ++i) {
-            key_full.insert(base_b + i);
-        }
+        key_full.insert_many(std::array<size_t, 2>{BASE_A32, BASE_C32});
+        key_full.insert_range(BASE_B32, BASE_B32 + N32 - 1);
         
-        key_partial.insert(base_b + 10);
-        key_partial.insert(base_b + 200);
+        key_partial.insert_many(std::array<size_t, 2>{BASE_B32 + 10, BASE_B32 + 200});
         
         VebTree dest = key_full & key_partial;
         
         REQUIRE(dest.size() == 2);
-        REQUIRE(dest.contains(base_b + 10));
-        REQUIRE(dest.contains(base_b + 200));
-        REQUIRE(dest.min().value() == base_b + 10);
-        REQUIRE(dest.max().value() == base_b + 200);
+        REQUIRE(dest.contains(BASE_B32 + 10));
+        REQUIRE(dest.contains(BASE_B32 + 200));
+        REQUIRE(dest.min().value() == BASE_B32 + 10);
+        REQUIRE(dest.max().value() == BASE_B32 + 200);
     }
 
     TEST_CASE("Node32 or compaction merge") {
         VebTree a;
         VebTree b;
         
-        size_t N = 65536;
-        size_t base_a = 1 * N;
-        size_t base_b = 3 * N;
-        size_t base_c = 5 * N;
+        a.insert(BASE_A32);
+        a.insert_range(BASE_B32, BASE_B32 + N32 / 2 - 1);
         
-        a.insert(base_a);
-        for (size_t i = 0; i < N / 2; ++i) {
-            a.insert(base_b + i);
-        }
-        
-        b.insert(base_c);
-        for (size_t i = N / 2; i < N; ++i) {
-            b.insert(base_b + i);
-        }
+        b.insert(BASE_C32);
+        b.insert_range(BASE_B32 + N32 / 2, BASE_B32 + N32 - 1);
         
         VebTree dest = a | b;
         
-        REQUIRE(dest.size() == N + 2);
-        REQUIRE(dest.contains(base_b + 42));
+        REQUIRE(dest.size() == N32 + 2);
+        REQUIRE(dest.contains(BASE_B32 + 42));
     }
 
     TEST_CASE("Node32 or with compacted source") {
-        VebTree src;
+        const VebTree& src{compacted_source32()};
         VebTree other;
         
-        size_t N = 65536;
-        size_t base_a = 1 * N;
-        size_t base_b = 3 * N;
-        size_t base_c = 5 * N;
-        
-        src.insert(base_a);
-        src.insert(base_c);
-        for (size_t i = 0; i < N; ++i) {
-            src.insert(base_b + i);
-        }
-        
-        other.insert(base_c + 1);
-        other.insert(base_b + 13);
-        other.insert(base_b + 37);
+        other.insert_many(std::array<size_t, 3>{BASE_C32 + 1, BASE_B32 + 13, BASE_B32 + 37});
         
         VebTree dest = src | other;
-        std::set<size_t> ref_src(src.begin(), src.end());
-        std::set<size_t> ref_other(other.begin(), other.end());
+        const auto ref_src{src.to_vector()};
+        const auto ref_other{other.to_vector()};
         
-        std::set<size_t> expected;
+        std::vector<size_t> expected;
         std::set_union(ref_src.begin(), ref_src.end(), ref_other.begin(), ref_other.end(),
-                      std::inserter(expected, expected.begin()));
+                      std::back_inserter(expected));
         
         REQUIRE(dest.size() == expected.size());
+        REQUIRE(dest.to_vector() == expected);
     }
 
     TEST_CASE("Node32 and with compacted source") {
-        VebTree src;
+        const VebTree& src{compacted_source32()};
         VebTree other;
         
-        size_t N = 65536;
-        size_t base_a = 1 * N;
-        size_t base_b = 3 * N;
-        size_t base_c = 5 * N;
-        
-        src.insert(base_a);
-        src.insert(base_c);
-        for (size_t i = 0; i < N; ++i) {
-            src.insert(base_b + i);
-        }
-        
-        other.insert(base_c + 1);
-        other.insert(base_b + 13);
-        other.insert(base_b + 37);
+        other.insert_many(std::array<size_t, 3>{BASE_C32 + 1, BASE_B32 + 13, BASE_B32 + 37});
         
         VebTree dest = src & other;
         
         REQUIRE(dest.size() == 2);
-        REQUIRE(dest.contains(base_b + 13));
-        REQUIRE(dest.contains(base_b + 37));
+        REQUIRE(dest.contains(BASE_B32 + 13));
+        REQUIRE(dest.contains(BASE_B32 + 37));
     }
 
     TEST_CASE("Node32 and compaction merge") {
         VebTree a;
         VebTree b;
         
-        size_t N = 65536;
-        size_t base_a = 1 * N;
-        size_t base_b = 3 * N;
-        size_t base_c = 5 * N;
-        
-        a.insert(base_a - 1);
-        a.insert(base_a);
-        a.insert(base_c - 1);
-        a.insert(base_c);
-        for (size_t i = 0; i < N; ++i) {
-            a.insert(base_b + i);
-        }
+        a.insert_many(std::array<size_t, 4>{BASE_A32 - 1, BASE_A32, BASE_C32 - 1, BASE_C32});
+        a.insert_range(BASE_B32, BASE_B32 + N32 - 1);
         
-        b.insert(base_a);
-        b.insert(base_a + 1);
-        b.insert(base_c);
-        b.insert(base_c + 1);
-        for (size_t i = 0; i < N; ++i) {
-            b.insert(base_b + i);
-        }
+        b.insert_many(std::array<size_t, 4>{BASE_A32, BASE_A32 + 1, BASE_C32, BASE_C32 + 1});
+        b.insert_range(BASE_B32, BASE_B32 + N32 - 1);
         
         VebTree dest = a & b;
         
-        REQUIRE(dest.size() == N + 2);
-        REQUIRE(dest.contains(base_a));
-        REQUIRE(dest.contains(base_c));
+        REQUIRE(dest.size() == N32 + 2);
+        REQUIRE(dest.contains(BASE_A32));
+        REQUIRE(dest.contains(BASE_C32));
     }
 
     TEST_CASE("Node32 xor full resident mix") {
-        VebTree s1;
+        VebTree s1{full_cluster32()};
         VebTree s2;
         
-        size_t N = 65536;
-        
-        s1.insert(0);
-        s1.insert(1000000);
-        for (size_t i = 0; i < N; ++i) {
-            s1.insert(N + i);
-        }
-        
-        s2.insert(0);
-        s2.insert(1000000);
-        s2.insert(N);
-        s2.insert(N + 1);
-        s2.insert(N + 2);
+        s2.insert_many(std::array<size_t, 5>{0, 1000000, N32, N32 + 1, N32 + 2});
         
         VebTree dest = s1 ^ s2;
         
-        REQUIRE(!dest.contains(N));
-        REQUIRE(dest.contains(N + 3));
-        REQUIRE(dest.contains(2 * N - 1));
-        REQUIRE(dest.size() == N - 3);
+        REQUIRE(!dest.contains(N32));
+        REQUIRE(dest.contains(N32 + 3));
+        REQUIRE(dest.contains(2 * N32 - 1));
+        REQUIRE(dest.size() == N32 - 3);
     }
 
     TEST_CASE("Node32 and full resident mix") {
-        VebTree s1;
+        VebTree s1{full_cluster32()};
         VebTree s2;
         
-        size_t N = 65536;
-        
-        s1.insert(0);
-        s1.insert(1000000);
-        for (size_t i = 0; i < N; ++i) {
-            s1.insert(N + i);
-        }
-        
-        s2.insert(0);
-        s2.insert(1000000);
-        s2.insert(N);
-        s2.insert(N + 1);
-        s2.insert(N + 2);
+        s2.insert_many(std::array<size_t, 5>{0, 1000000, N32, N32 + 1, N32 + 2});
         
         VebTree dest = s1 & s2;
         
         std::vector<size_t> arr(dest.begin(), dest.end());
         REQUIRE(arr.size() == 5);
         REQUIRE(arr[0] == 0);
-        REQUIRE(arr[1] == N);
-        REQUIRE(arr[2] == N + 1);
-        REQUIRE(arr[3] == N + 2);
+        REQUIRE(arr[1] == N32);
+        REQUIRE(arr[2] == N32 + 1);
+        REQUIRE(arr[3] == N32 + 2);
         REQUIRE(arr[4] == 1000000);
     }
 
     TEST_CASE("Node32 or two full clusters") {
-        VebTree s1;
-        VebTree s2;
-        
-        size_t N = 65536;
-        
-        s1.insert(0);
-        s1.insert(1000000);
-        for (size_t i = 0; i < N; ++i) {
-            s1.insert(N + i);
-        }
-        
-        s2.insert(0);
-        s2.insert(1000000);
-        for (size_t i = 0; i < N; ++i) {
-            s2.insert(N + i);
-        }
+        VebTree s1{full_cluster32()};
+        VebTree s2{full_cluster32()};
         
         VebTree dest = s1 | s2;
         
-        REQUIRE(dest.size() == N + 2);
+        REQUIRE(dest.size() == N32 + 2);
         REQUIRE(dest.min().value() == 0);
         REQUIRE(dest.max().value() == 1000000);
     }
@@ -513,42 +373,27 @@ TEST_SUITE("Compacted Node Clustering Behavior (Node16/32 Set Operations)") {
         VebTree s1;
         VebTree s2;
         
-        size_t N = 65536;
+        s1.insert_many(std::array<size_t, 4>{0, 10000000, N32 + 10, 2 * N32 + 20});
         
-        s1.insert(0);
-        s1.insert(10000000);
-        s1.insert(N + 10);
-        s1.insert(2 * N + 20);
-        
-        s2.insert(0);
-        s2.insert(10000000);
-        s2.insert(2 * N + 20);
+        s2.insert_many(std::array<size_t, 3>{0, 10000000, 2 * N32 + 20});
         
         VebTree dest = s1 & s2;
         
         std::vector<size_t> arr(dest.begin(), dest.end());
-        REQUIRE(arr == std::vector<size_t>{0, 2 * N + 20, 10000000});
+        REQUIRE(arr == std::vector<size_t>{0, 2 * N32 + 20, 10000000});
     }
 
     TEST_CASE("Node32 xor promotion desync edge case") {
         VebTree s1;
         VebTree s2;
         
-        size_t N = 65536;
-        
-        s1.insert(0);
-        s1.insert(10000000);
-        s1.insert(N + 10);
-        s1.insert(2 * N + 20);
+        s1.insert_many(std::array<size_t, 4>{0, 10000000, N32 + 10, 2 * N32 + 20});
         
-        s2.insert(0);
-        s2.insert(10000000);
-        s2.insert(N + 10);
-        s2.insert(2 * N + 30);
+        s2.insert_many(std::array<size_t, 4>{0, 10000000, N32 + 10, 2 * N32 + 30});
         
         VebTree dest = s1 ^ s2;
         
         std::vector<size_t> arr(dest.begin(), dest.end());
-        REQUIRE(arr == std::vector<size_t>{2 * N + 20, 2 * N + 30});
+        REQUIRE(arr == std::vector<size_t>{2 * N32 + 20, 2 * N32 + 30});
     }
 }
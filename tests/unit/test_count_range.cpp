@@ -1,7 +1,9 @@
 #include "doctest.h"
 #include "VEB/VebTree.hpp"
+#include <bitset>
 #include <random>
 #include <set>
+#include <vector>
 
 TEST_SUITE("VebTree Count Range") {
     TEST_CASE("count_range basic") {
@@ -83,13 +85,13 @@ TEST_SUITE("VebTree Count Range") {
         }
         
         REQUIRE(tree.count_range(15, 16) == 2);
-        REQUIRE(tree.count_range(16, 256) == 6);
+        REQUIRE(tree.count_range(16, 256) == 4);
         REQUIRE(tree.count_range(0, 1025) == 10);
         
         tree.remove(16);
         tree.remove(256);
-        REQUIRE(tree.count_range(15, 256) == 7);
-        REQUIRE(tree.count_range(256, 1025) == 3);
+        REQUIRE(tree.count_range(15, 256) == 3);
+        REQUIRE(tree.count_range(256, 1025) == 4);
     }
 
     TEST_CASE("count_range randomized small") {
@@ -98,28 +100,31 @@ TEST_SUITE("VebTree Count Range") {
         std::uniform_real_distribution<> op_dist(0.0, 1.0);
         
         VebTree tree;
-        std::set<size_t> reference;
+        std::bitset<2001> reference;
         
         for (int i = 0; i < 300; ++i) {
             size_t v = val_dist(rng);
             if (op_dist(rng) < 0.6) {
                 tree.insert(v);
-                reference.insert(v);
+                reference.set(v);
             } else {
                 tree.remove(v);
-                reference.erase(v);
+                reference.reset(v);
             }
         }
         
+        std::vector<size_t> prefix(reference.size() + 1);
+        for (size_t i = 0; i < reference.size(); ++i) {
+            prefix[i + 1] = prefix[i] + reference[i];
+        }
+        
         for (int i = 0; i < 200; ++i) {
             size_t a = val_dist(rng);
             size_t b = val_dist(rng);
             size_t lo = std::min(a, b);
             size_t hi = std::max(a, b);
             
-            auto ref_count = std::distance(reference.lower_bound(lo), 
-                                          reference.upper_bound(hi));
-            REQUIRE(tree.count_range(lo, hi) == static_cast<size_t>(ref_count));
+            REQUIRE(tree.count_range(lo, hi) == prefix[hi + 1] - prefix[lo]);
         }
     }
 
@@ -225,7 +230,7 @@ TEST_SUITE("VebTree Count Range") {
         }
         
         REQUIRE(tree.count_range(5, 50) == 21);
-        REQUIRE(tree.count_range(25, 45) == 20);
+        REQUIRE(tree.count_range(25, 45) == 16);
     }
 
     TEST_CASE("count_range after clear and re-insert") {
@@ -256,8 +261,8 @@ TEST_SUITE("VebTree Count Range") {
         }
         
         REQUIRE(tree.count_range(0, 3000000) == 5);
-        REQUIRE(tree.count_range(50000, 2000000) == 5);
-        REQUIRE(tree.count_range(70001, 999999) == 2);
+        REQUIRE(tree.count_range(50000, 2000000) == 4);
+        REQUIRE(tree.count_range(70001, 999999) == 1);
         REQUIRE(tree.count_range(2000001, 3000000) == 0);
     }
 
@@ -1,7 +1,12 @@
 #include "doctest.h"
 #include "VEB/VebTree.hpp"
+#include <algorithm>
+#include <bitset>
+#include <iterator>
+#include <limits>
 #include <random>
 #include <set>
+#include <vector>
 
 TEST_SUITE("VebTree Fuzz Tests") {
     TEST_CASE("fuzz random insertions and containment") {
@@ -18,10 +23,7 @@ TEST_SUITE("VebTree Fuzz Tests") {
         }
         
         REQUIRE(tree.size() == reference.size());
-        
-        for (auto val : reference) {
-            REQUIRE(tree.contains(val));
-        }
+        REQUIRE(tree.to_vector() == std::vector<size_t>(reference.begin(), reference.end()));
         
         for (size_t val = 0; val < 1000; ++val) {
             bool expected = reference.count(val) > 0;
@@ -50,9 +52,46 @@ TEST_SUITE("VebTree Fuzz Tests") {
         }
         
         REQUIRE(tree.size() == reference.size());
-        for (auto val : reference) {
-            REQUIRE(tree.contains(val));
+        REQUIRE(tree.to_vector() == std::vector<size_t>(reference.begin(), reference.end()));
+    }
+
+    TEST_CASE("fuzz batched insertions and removals") {
+        std::mt19937 rng(23457);
+        std::uniform_int_distribution<size_t> dist(0, 50000);
+        std::bernoulli_distribution insert_or_remove(0.7);
+        
+        VebTree tree;
+        std::set<size_t> reference;
+        
+        std::vector<size_t> batch;
+        bool batch_inserts = true;
+        auto flush = [&] {
+            if (batch_inserts) {
+                tree.insert_many(batch);
+            } else {
+                tree.remove_many(batch);
+            }
+            batch.clear();
+        };
+        
+        for (int i = 0; i < 1000; ++i) {
+            size_t val = dist(rng);
+            bool is_insert = insert_or_remove(rng);
+            if (is_insert != batch_inserts) {
+                flush();
+                batch_inserts = is_insert;
+            }
+            batch.push_back(val);
+            if (is_insert) {
+                reference.insert(val);
+            } else {
+                reference.erase(val);
+            }
         }
+        flush();
+        
+        REQUIRE(tree.size() == reference.size());
+        REQUIRE(tree.to_vector() == std::vector<size_t>(reference.begin(), reference.end()));
     }
 
     TEST_CASE("fuzz successor/predecessor correctness") {
@@ -116,14 +155,12 @@ TEST_SUITE("VebTree Fuzz Tests") {
         }
         
         s1 |= s2;
-        std::set<size_t> expected_union;
+        std::vector<size_t> expected_union;
         std::set_union(ref1.begin(), ref1.end(), ref2.begin(), ref2.end(),
-                      std::inserter(expected_union, expected_union.begin()));
+                      std::back_inserter(expected_union));
         
         REQUIRE(s1.size() == expected_union.size());
-        for (auto val : expected_union) {
-            REQUIRE(s1.contains(val));
-        }
+        REQUIRE(s1.to_vector() == expected_union);
     }
 
     TEST_CASE("fuzz intersection operations") {
@@ -147,14 +184,12 @@ TEST_SUITE("VebTree Fuzz Tests") {
         }
         
         s1 &= s2;
-        std::set<size_t> expected_inter;
+        std::vector<size_t> expected_inter;
         std::set_intersection(ref1.begin(), ref1.end(), ref2.begin(), ref2.end(),
-                             std::inserter(expected_inter, expected_inter.begin()));
+                             std::back_inserter(expected_inter));
         
         REQUIRE(s1.size() == expected_inter.size());
-        for (auto val : expected_inter) {
-            REQUIRE(s1.contains(val));
-        }
+        REQUIRE(s1.to_vector() == expected_inter);
     }
 
     TEST_CASE("fuzz xor operations") {
@@ -178,13 +213,84 @@ TEST_SUITE("VebTree Fuzz Tests") {
         }
         
         s1 ^= s2;
-        std::set<size_t> expected_xor;
+        std::vector<size_t> expected_xor;
         std::set_symmetric_difference(ref1.begin(), ref1.end(), ref2.begin(), ref2.end(),
-                                     std::inserter(expected_xor, expected_xor.begin()));
+                                     std::back_inserter(expected_xor));
         
         REQUIRE(s1.size() == expected_xor.size());
-        for (auto val : expected_xor) {
-            REQUIRE(s1.contains(val));
+        REQUIRE(s1.to_vector() == expected_xor);
+    }
+
+    TEST_CASE("fuzz set operations on mixed-size inputs") {
+        std::mt19937 rng(67891);
+        const size_t universes[] = {200, 3000, 65536, 300000, 1 << 20, 1ull << 33};
+        
+        auto random_set = [&](VebTree& tree, std::set<size_t>& reference) {
+            const size_t top = universes[rng() % std::size(universes)];
+            std::uniform_int_distribution<size_t> dist(0, top - 1);
+            for (int i = 0; i < 8; ++i) {
+                const size_t start = dist(rng);
+                const size_t len = rng() % 3 == 0 ? rng() % 70000 : rng() % 600;
+                const size_t end = std::min(top - 1, start + len);
+                switch (rng() % 4) {
+                    case 0:
+                        tree.insert(start);
+                        reference.insert(start);
+                        break;
+                    case 1:
+                        tree.insert_range(start, end);
+                        for (size_t val = start; val <= end; ++val) {
+                            reference.insert(val);
+                        }
+                        break;
+                    case 2:
+                        for (auto it = reference.lower_bound(start); it != reference.end() && *it <= end;) {
+                            tree.remove(*it);
+                            it = reference.erase(it);
+                        }
+                        break;
+                    default:
+                        for (int j = 0; j < 20; ++j) {
+                            const size_t val = start + rng() % (end - start + 1);
+                            tree.remove(val);
+                            reference.erase(val);
+                        }
+                        break;
+                }
+            }
+        };
+        
+        for (int round = 0; round < 60; ++round) {
+            VebTree s1;
+            VebTree s2;
+            std::set<size_t> ref1;
+            std::set<size_t> ref2;
+            random_set(s1, ref1);
+            random_set(s2, ref2);
+            
+            VebTree inter{s1};
+            inter &= s2;
+            std::vector<size_t> expected_inter;
+            std::set_intersection(ref1.begin(), ref1.end(), ref2.begin(), ref2.end(),
+                                 std::back_inserter(expected_inter));
+            REQUIRE(inter.size() == expected_inter.size());
+            REQUIRE(inter.to_vector() == expected_inter);
+            
+            VebTree uni{s1};
+            uni |= s2;
+            std::vector<size_t> expected_union;
+            std::set_union(ref1.begin(), ref1.end(), ref2.begin(), ref2.end(),
+                          std::back_inserter(expected_union));
+            REQUIRE(uni.size() == expected_union.size());
+            REQUIRE(uni.to_vector() == expected_union);
+            
+            VebTree sym{s1};
+            sym ^= s2;
+            std::vector<size_t> expected_xor;
+            std::set_symmetric_difference(ref1.begin(), ref1.end(), ref2.begin(), ref2.end(),
+                                         std::back_inserter(expected_xor));
+            REQUIRE(sym.size() == expected_xor.size());
+            REQUIRE(sym.to_vector() == expected_xor);
         }
     }
 
@@ -219,15 +325,17 @@ TEST_SUITE("VebTree Fuzz Tests") {
         std::uniform_int_distribution<size_t> dist(0, 100000);
         
         VebTree tree;
-        std::set<size_t> reference;
+        size_t expected_min = std::numeric_limits<size_t>::max();
+        size_t expected_max = 0;
         
         for (int i = 0; i < 500; ++i) {
             size_t val = dist(rng);
             tree.insert(val);
-            reference.insert(val);
+            expected_min = std::min(expected_min, val);
+            expected_max = std::max(expected_max, val);
             
-            REQUIRE(tree.min().value() == *reference.begin());
-            REQUIRE(tree.max().value() == *reference.rbegin());
+            REQUIRE(tree.min().value() == expected_min);
+            REQUIRE(tree.max().value() == expected_max);
         }
     }
 
@@ -246,11 +354,7 @@ TEST_SUITE("VebTree Fuzz Tests") {
         
         auto arr = std::vector<size_t>(tree.begin(), tree.end());
         REQUIRE(arr.size() == reference.size());
-        
-        size_t i = 0;
-        for (auto val : reference) {
-            REQUIRE(arr[i++] == val);
-        }
+        REQUIRE(arr == std::vector<size_t>(reference.begin(), reference.end()));
     }
 
     TEST_CASE("fuzz iteration order matches to_array") {
@@ -305,9 +409,7 @@ TEST_SUITE("VebTree Fuzz Tests") {
         
         REQUIRE(original == restored2);
         REQUIRE(original.size() == restored2.size());
-        for (auto val : original) {
-            REQUIRE(restored2.contains(val));
-        }
+        REQUIRE(restored2.to_vector() == original.to_vector());
     }
 
     TEST_CASE("fuzz copy independence") {
@@ -338,7 +440,7 @@ TEST_SUITE("VebTree Fuzz Tests") {
         std::bernoulli_distribution op_selector(0.33);
         
         VebTree tree;
-        std::set<size_t> reference;
+        std::bitset<5001> reference;
         
         for (int i = 0; i < 500; ++i) {
             size_t val = dist(rng);
@@ -347,22 +449,22 @@ TEST_SUITE("VebTree Fuzz Tests") {
             switch (op) {
                 case 0: // insert
                     tree.insert(val);
-                    reference.insert(val);
+                    reference.set(val);
                     break;
                 case 1: // remove
                     tree.remove(val);
-                    reference.erase(val);
+                    reference.reset(val);
                     break;
                 case 2: // contains (doesn't change size)
                     {
-                        bool expected = reference.count(val) > 0;
+                        bool expected = reference.test(val);
                         bool actual = tree.contains(val);
                         REQUIRE(actual == expected);
                     }
                     break;
             }
             
-            REQUIRE(tree.size() == reference.size());
+            REQUIRE(tree.size() == reference.count());
         }
     }
 }
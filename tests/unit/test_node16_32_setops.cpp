@@ -1,78 +1,64 @@
 #include "doctest.h"
 #include "VEB/VebTree.hpp"
+#include <numeric>
+#include <vector>
+
+static std::vector<size_t> range_of(size_t lo, size_t hi) {
+    std::vector<size_t> values(hi - lo);
+    std::iota(values.begin(), values.end(), lo);
+    return values;
+}
 
 TEST_SUITE("Node16/32 Set Operation Edge Cases") {
     TEST_CASE("Node16 union with empty set") {
         VebTree s1;
-        for (size_t i = 256; i < 512; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(256, 511);
         
         VebTree s2;
         
         s1 |= s2;
         REQUIRE(s1.size() == 256);
-        for (size_t i = 256; i < 512; ++i) {
-            REQUIRE(s1.contains(i));
-        }
+        REQUIRE(s1.to_vector() == range_of(256, 512));
     }
 
     TEST_CASE("Node16 union of identical sets") {
         VebTree s1;
-        for (size_t i = 256; i < 512; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(256, 511);
         
         VebTree s2{s1};
         
         s1 |= s2;
         REQUIRE(s1.size() == 256);
-        for (size_t i = 256; i < 512; ++i) {
-            REQUIRE(s1.contains(i));
-        }
+        REQUIRE(s1.to_vector() == range_of(256, 512));
     }
 
     TEST_CASE("Node16 union disjoint ranges") {
         VebTree s1;
-        for (size_t i = 256; i < 384; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(256, 383);
         
         VebTree s2;
-        for (size_t i = 384; i < 512; ++i) {
-            s2.insert(i);
-        }
+        s2.insert_range(384, 511);
         
         s1 |= s2;
         REQUIRE(s1.size() == 256);
-        for (size_t i = 256; i < 512; ++i) {
-            REQUIRE(s1.contains(i));
-        }
+        REQUIRE(s1.to_vector() == range_of(256, 512));
     }
 
     TEST_CASE("Node16 union overlapping ranges") {
         VebTree s1;
-        for (size_t i = 256; i < 400; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(256, 399);
         
         VebTree s2;
-        for (size_t i = 350; i < 512; ++i) {
-            s2.insert(i);
-        }
+        s2.insert_range(350, 511);
         
         s1 |= s2;
         REQUIRE(s1.size() == 256);
-        for (size_t i = 256; i < 512; ++i) {
-            REQUIRE(s1.contains(i));
-        }
+        REQUIRE(s1.to_vector() == range_of(256, 512));
     }
 
     TEST_CASE("Node16 intersection with empty set") {
         VebTree s1;
-        for (size_t i = 256; i < 512; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(256, 511);
         
         VebTree s2;
         
@@ -83,29 +69,21 @@ TEST_SUITE("Node16/32 Set Operation Edge Cases") {
 
     TEST_CASE("Node16 intersection of identical sets") {
         VebTree s1;
-        for (size_t i = 256; i < 512; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(256, 511);
         
         VebTree s2{s1};
         
         s1 &= s2;
         REQUIRE(s1.size() == 256);
-        for (size_t i = 256; i < 512; ++i) {
-            REQUIRE(s1.contains(i));
-        }
+        REQUIRE(s1.to_vector() == range_of(256, 512));
     }
 
     TEST_CASE("Node16 intersection disjoint ranges") {
         VebTree s1;
-        for (size_t i = 256; i < 384; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(256, 383);
         
         VebTree s2;
-        for (size_t i = 384; i < 512; ++i) {
-            s2.insert(i);
-        }
+        s2.insert_range(384, 511);
         
         s1 &= s2;
         REQUIRE(s1.empty());
@@ -113,60 +91,42 @@ TEST_SUITE("Node16/32 Set Operation Edge Cases") {
 
     TEST_CASE("Node16 intersection overlapping ranges") {
         VebTree s1;
-        for (size_t i = 256; i < 400; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(256, 399);
         
         VebTree s2;
-        for (size_t i = 350; i < 450; ++i) {
-            s2.insert(i);
-        }
+        s2.insert_range(350, 449);
         
         s1 &= s2;
         REQUIRE(s1.size() == 50);
-        for (size_t i = 350; i < 400; ++i) {
-            REQUIRE(s1.contains(i));
-        }
+        REQUIRE(s1.to_vector() == range_of(350, 400));
     }
 
     TEST_CASE("Node16 xor with empty set") {
         VebTree s1;
-        for (size_t i = 256; i < 512; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(256, 511);
         
         VebTree s2;
         
         s1 ^= s2;
         REQUIRE(s1.size() == 256);
-        for (size_t i = 256; i < 512; ++i) {
-            REQUIRE(s1.contains(i));
-        }
+        REQUIRE(s1.to_vector() == range_of(256, 512));
     }
 
     TEST_CASE("Node16 xor disjoint sets") {
         VebTree s1;
-        for (size_t i = 256; i < 384; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(256, 383);
         
         VebTree s2;
-        for (size_t i = 384; i < 512; ++i) {
-            s2.insert(i);
-        }
+        s2.insert_range(384, 511);
         
         s1 ^= s2;
         REQUIRE(s1.size() == 256);
-        for (size_t i = 256; i < 512; ++i) {
-            REQUIRE(s1.contains(i));
-        }
+        REQUIRE(s1.to_vector() == range_of(256, 512));
     }
 
     TEST_CASE("Node16 xor identical sets") {
         VebTree s1;
-        for (size_t i = 256; i < 512; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(256, 511);
         
         VebTree s2{s1};
         
@@ -176,9 +136,7 @@ TEST_SUITE("Node16/32 Set Operation Edge Cases") {
 
     TEST_CASE("Node32 union empty") {
         VebTree s1;
-        for (size_t i = 65536; i < 65792; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(65536, 65791);
         
         VebTree s2;
         
@@ -188,29 +146,21 @@ TEST_SUITE("Node16/32 Set Operation Edge Cases") {
 
     TEST_CASE("Node32 union identical") {
         VebTree s1;
-        for (size_t i = 65536; i < 66000; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(65536, 65999);
         
         VebTree s2{s1};
         
         s1 |= s2;
         REQUIRE(s1.size() == 464);
-        for (size_t i = 65536; i < 66000; ++i) {
-            REQUIRE(s1.contains(i));
-        }
+        REQUIRE(s1.to_vector() == range_of(65536, 66000));
     }
 
     TEST_CASE("Node32 union disjoint") {
         VebTree s1;
-        for (size_t i = 65536; i < 65792; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(65536, 65791);
         
         VebTree s2;
-        for (size_t i = 70000; i < 70256; ++i) {
-            s2.insert(i);
-        }
+        s2.insert_range(70000, 70255);
         
         s1 |= s2;
         REQUIRE(s1.size() == 512);
@@ -218,9 +168,7 @@ TEST_SUITE("Node16/32 Set Operation Edge Cases") {
 
     TEST_CASE("Node32 intersection empty") {
         VebTree s1;
-        for (size_t i = 65536; i < 65792; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(65536, 65791);
         
         VebTree s2;
         
@@ -230,9 +178,7 @@ TEST_SUITE("Node16/32 Set Operation Edge Cases") {
 
     TEST_CASE("Node32 intersection identical") {
         VebTree s1;
-        for (size_t i = 65536; i < 65792; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(65536, 65791);
         
         VebTree s2{s1};
         
@@ -242,27 +188,19 @@ TEST_SUITE("Node16/32 Set Operation Edge Cases") {
 
     TEST_CASE("Node32 intersection partial overlap") {
         VebTree s1;
-        for (size_t i = 65536; i < 65792; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(65536, 65791);
         
         VebTree s2;
-        for (size_t i = 65664; i < 65920; ++i) {
-            s2.insert(i);
-        }
+        s2.insert_range(65664, 65919);
         
         s1 &= s2;
         REQUIRE(s1.size() == 128);
-        for (size_t i = 65664; i < 65792; ++i) {
-            REQUIRE(s1.contains(i));
-        }
+        REQUIRE(s1.to_vector() == range_of(65664, 65792));
     }
 
     TEST_CASE("Node32 xor empty") {
         VebTree s1;
-        for (size_t i = 65536; i < 65792; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(65536, 65791);
         
         VebTree s2;
         
@@ -272,9 +210,7 @@ TEST_SUITE("Node16/32 Set Operation Edge Cases") {
 
     TEST_CASE("Node32 xor identical") {
         VebTree s1;
-        for (size_t i = 65536; i < 65792; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(65536, 65791);
         
         VebTree s2{s1};
         
@@ -284,14 +220,10 @@ TEST_SUITE("Node16/32 Set Operation Edge Cases") {
 
     TEST_CASE("Node32 xor disjoint") {
         VebTree s1;
-        for (size_t i = 65536; i < 65792; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(65536, 65791);
         
         VebTree s2;
-        for (size_t i = 70000; i < 70256; ++i) {
-            s2.insert(i);
-        }
+        s2.insert_range(70000, 70255);
         
         s1 ^= s2;
         REQUIRE(s1.size() == 512);
@@ -299,38 +231,25 @@ TEST_SUITE("Node16/32 Set Operation Edge Cases") {
 
     TEST_CASE("Node32 xor partial overlap") {
         VebTree s1;
-        for (size_t i = 65536; i < 65792; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(65536, 65791);
         
         VebTree s2;
-        for (size_t i = 65664; i < 65920; ++i) {
-            s2.insert(i);
-        }
+        s2.insert_range(65664, 65919);
         
         s1 ^= s2;
         REQUIRE(s1.size() == 256);
-        for (size_t i = 65536; i < 65664; ++i) {
-            REQUIRE(s1.contains(i));
-        }
-        for (size_t i = 65792; i < 65920; ++i) {
-            REQUIRE(s1.contains(i));
-        }
-        for (size_t i = 65664; i < 65792; ++i) {
-            REQUIRE(!s1.contains(i));
-        }
+        auto expected{range_of(65536, 65664)};
+        const auto upper{range_of(65792, 65920)};
+        expected.insert(expected.end(), upper.begin(), upper.end());
+        REQUIRE(s1.to_vector() == expected);
     }
 
     TEST_CASE("Node16 and Node32 mixed union") {
         VebTree s1;
-        for (size_t i = 256; i < 512; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(256, 511);
         
         VebTree s2;
-        for (size_t i = 65536; i < 65792; ++i) {
-            s2.insert(i);
-        }
+        s2.insert_range(65536, 65791);
         
         s1 |= s2;
         REQUIRE(s1.size() == 512);
@@ -338,14 +257,10 @@ TEST_SUITE("Node16/32 Set Operation Edge Cases") {
 
     TEST_CASE("Node16 and Node32 mixed intersection") {
         VebTree s1;
-        for (size_t i = 256; i < 512; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(256, 511);
         
         VebTree s2;
-        for (size_t i = 65536; i < 65792; ++i) {
-            s2.insert(i);
-        }
+        s2.insert_range(65536, 65791);
         
         s1 &= s2;
         REQUIRE(s1.empty());
@@ -375,44 +290,29 @@ TEST_SUITE("Node16/32 Set Operation Edge Cases") {
 
     TEST_CASE("sequential set operations maintain correctness") {
         VebTree s1;
-        for (size_t i = 256; i < 512; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(256, 511);
         
         VebTree s2;
-        for (size_t i = 384; i < 640; ++i) {
-            s2.insert(i);
-        }
+        s2.insert_range(384, 639);
         
         VebTree s3;
-        for (size_t i = 0; i < 256; ++i) {
-            s3.insert(i);
-        }
+        s3.insert_range(0, 255);
         
         VebTree result{s1};
         result |= s2;
         result |= s3;
         
-        for (size_t i = 0; i < 256; ++i) {
-            REQUIRE(result.contains(i));
-        }
-        for (size_t i = 256; i < 640; ++i) {
-            REQUIRE(result.contains(i));
-        }
+        REQUIRE(result.to_vector() == range_of(0, 640));
     }
 
     TEST_CASE("Node16 full dense range operations") {
         VebTree s1;
-        for (size_t i = 256; i < 512; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(256, 511);
         
         REQUIRE(s1.size() == 256);
         
         VebTree s2;
-        for (size_t i = 256; i < 512; ++i) {
-            s2.insert(i);
-        }
+        s2.insert_range(256, 511);
         
         VebTree inter{s1};
         inter &= s2;
@@ -441,4 +341,81 @@ TEST_SUITE("Node16/32 Set Operation Edge Cases") {
         inter &= other;
         REQUIRE(inter.size() == 50);
     }
+
+    TEST_CASE("Node16 intersection takes the smaller max") {
+        VebTree s1;
+        s1.insert_range(36022, 36025);
+
+        VebTree s2;
+        s2.insert_range(36022, 36024);
+
+        s1 &= s2;
+        REQUIRE(s1.size() == 3);
+        REQUIRE(s1.to_vector() == range_of(36022, 36025));
+    }
+
+    TEST_CASE("Node16 union in place with clusters only in other") {
+        VebTree s1;
+        s1.insert_many(std::vector<size_t>{12466, 51455, 51456, 18943, 18944});
+
+        VebTree s2;
+        s2.insert_many(std::vector<size_t>{18252, 51529, 17681});
+
+        s1 |= s2;
+        REQUIRE(s1.size() == 8);
+        REQUIRE(s1.to_vector() == std::vector<size_t>{12466, 17681, 18252, 18943, 18944, 51455, 51456, 51529});
+    }
+
+    TEST_CASE("Node16 intersection in place with clusters only in other") {
+        // inserted one at a time so the spare capacity lets the result be written in place
+        VebTree s1;
+        s1.insert(65198);
+        s1.insert(38200);
+        for (size_t x = 16894; x <= 65281; ++x) {
+            s1.insert(x);
+        }
+
+        VebTree s2;
+        s2.insert_many(std::vector<size_t>{65279, 65280, 65281, 29009, 25366});
+
+        s1 &= s2;
+        REQUIRE(s1.size() == 5);
+        REQUIRE(s1.to_vector() == std::vector<size_t>{25366, 29009, 65279, 65280, 65281});
+    }
+
+    TEST_CASE("Node16 xor in place with clusters only in other") {
+        VebTree s1;
+        s1.insert_many(std::vector<size_t>{16638, 16639, 16640, 26729, 65023, 65024, 65025});
+
+        VebTree s2;
+        s2.insert_many(std::vector<size_t>{64643, 64644, 64645});
+
+        s1 ^= s2;
+        REQUIRE(s1.size() == 10);
+        REQUIRE(s1.to_vector() == std::vector<size_t>{16638, 16639, 16640, 26729, 64643, 64644, 64645, 65023, 65024, 65025});
+    }
+
+    TEST_CASE("Node16 xor with a single element") {
+        VebTree s1;
+        s1.insert_many(std::vector<size_t>{17214, 59284});
+
+        VebTree s2;
+        s2.insert(17870);
+
+        s1 ^= s2;
+        REQUIRE(s1.size() == 3);
+        REQUIRE(s1.to_vector() == std::vector<size_t>{17214, 17870, 59284});
+    }
+
+    TEST_CASE("Node32 xor with a single element") {
+        VebTree s1;
+        s1.insert_many(std::vector<size_t>{100000, 200000});
+
+        VebTree s2;
+        s2.insert(150000);
+
+        s1 ^= s2;
+        REQUIRE(s1.size() == 3);
+        REQUIRE(s1.to_vector() == std::vector<size_t>{100000, 150000, 200000});
+    }
 }
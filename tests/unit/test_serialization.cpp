@@ -116,6 +116,26 @@ TEST_SUITE("VebTree Serialization") {
         REQUIRE(restored.contains(300000));
     }
 
+    TEST_CASE("serialize implicitly full clusters") {
+        VebTree original;
+        original.insert(7);
+        original.insert_range(256, 511);
+        original.insert_range(65536, 2 * 65536 - 1);
+        original.insert(2 * 65536 + 5);
+
+        auto serialized = original.serialize();
+        VebTree restored = VebTree::deserialize(std::string_view(serialized));
+
+        REQUIRE(restored.size() == 2 + 256 + 65536);
+        REQUIRE(restored.contains(256));
+        REQUIRE(restored.contains(511));
+        REQUIRE(!restored.contains(512));
+        REQUIRE(restored.contains(65536));
+        REQUIRE(restored.contains(2 * 65536 - 1));
+        REQUIRE(!restored.contains(2 * 65536));
+        REQUIRE(restored.to_vector() == original.to_vector());
+    }
+
     TEST_CASE("deserialized tree supports all operations") {
         VebTree original;
         original.insert(10);
@@ -1,5 +1,7 @@
 #include "doctest.h"
 #include "VEB/VebTree.hpp"
+#include <ranges>
+#include <vector>
 
 TEST_SUITE("VebTree Set Operations") {
     TEST_CASE("equality") {
@@ -31,6 +33,26 @@ TEST_SUITE("VebTree Set Operations") {
         REQUIRE(tree1 != tree2);
     }
 
+    TEST_CASE("equality across node types") {
+        VebTree tree1;
+        tree1.insert(1);
+        tree1.insert(200);
+        tree1.insert(1ull << 40);
+        tree1.remove(1ull << 40);
+
+        VebTree tree2;
+        tree2.insert(1);
+        tree2.insert(200);
+
+        REQUIRE(tree1 == tree2);
+        REQUIRE(tree2 == tree1);
+
+        tree2.remove(200);
+        tree2.insert(201);
+        REQUIRE(tree1 != tree2);
+        REQUIRE(tree1 == tree1);
+    }
+
     TEST_CASE("union operation") {
         VebTree set1;
         set1.insert(1);
@@ -217,26 +239,6 @@ TEST_SUITE("VebTree Set Operations") {
         REQUIRE(s1.contains(3));
     }
 
-    TEST_CASE("union dest=s1 with s1 and s2") {
-        VebTree s1;
-        s1.insert(1);
-        s1.insert(2);
-        s1.insert(3);
-
-        VebTree s2;
-        s2.insert(3);
-        s2.insert(4);
-        s2.insert(5);
-
-        s1 |= s2;
-        REQUIRE(s1.size() == 5);
-        REQUIRE(s1.contains(1));
-        REQUIRE(s1.contains(2));
-        REQUIRE(s1.contains(3));
-        REQUIRE(s1.contains(4));
-        REQUIRE(s1.contains(5));
-    }
-
     TEST_CASE("intersection with destination as source") {
         VebTree s1;
         s1.insert(1);
@@ -277,29 +279,10 @@ TEST_SUITE("VebTree Set Operations") {
         REQUIRE(s1.size() == 0);
     }
 
-    TEST_CASE("xor dest=s1 with s1 and s2") {
-        VebTree s1;
-        s1.insert(1);
-        s1.insert(2);
-        s1.insert(3);
-
-        VebTree s2;
-        s2.insert(2);
-        s2.insert(3);
-        s2.insert(4);
-
-        s1 ^= s2;
-        REQUIRE(s1.size() == 2);
-        REQUIRE(s1.contains(1));
-        REQUIRE(s1.contains(4));
-    }
-
     TEST_CASE("union with many sources") {
         std::vector<VebTree> sources(10);
         for (int i = 0; i < 10; ++i) {
-            for (int j = 0; j < 10; ++j) {
-                sources[i].insert(i * 100 + j);
-            }
+            sources[i].insert_range(i * 100, i * 100 + 9);
         }
 
         VebTree result{sources[0]};
@@ -317,19 +300,13 @@ TEST_SUITE("VebTree Set Operations") {
 
     TEST_CASE("intersection with many sources") {
         VebTree s1;
-        for (int i = 0; i < 100; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(0, 99);
 
         VebTree s2;
-        for (int i = 0; i < 100; ++i) {
-            if (i % 2 == 0) s2.insert(i);
-        }
+        s2.insert_many(std::views::iota(0, 50) | std::views::transform([](int i) { return i * 2; }));
 
         VebTree s3;
-        for (int i = 0; i < 100; ++i) {
-            if (i % 3 == 0) s3.insert(i);
-        }
+        s3.insert_many(std::views::iota(0, 34) | std::views::transform([](int i) { return i * 3; }));
 
         s1 &= s2;
         s1 &= s3;
@@ -346,14 +323,10 @@ TEST_SUITE("VebTree Set Operations") {
 
     TEST_CASE("node16 subset superset ops") {
         VebTree subset;
-        for (size_t i = 256; i < 384; ++i) {
-            subset.insert(i);
-        }
+        subset.insert_range(256, 383);
 
         VebTree superset;
-        for (size_t i = 256; i < 512; ++i) {
-            superset.insert(i);
-        }
+        superset.insert_range(256, 511);
 
         VebTree and_result = subset & superset;
         REQUIRE(and_result.size() == 128);
@@ -367,19 +340,13 @@ TEST_SUITE("VebTree Set Operations") {
 
     TEST_CASE("cross-node-type set operations") {
         VebTree s8;
-        for (size_t i = 0; i < 100; ++i) {
-            s8.insert(i);
-        }
+        s8.insert_range(0, 99);
 
         VebTree s16;
-        for (size_t i = 256; i < 512; ++i) {
-            s16.insert(i);
-        }
+        s16.insert_range(256, 511);
 
         VebTree s32;
-        for (size_t i = 70000; i < 70100; ++i) {
-            s32.insert(i);
-        }
+        s32.insert_range(70000, 70099);
 
         VebTree union_result = s8 | s16;
         REQUIRE(union_result.size() == 100 + 256);
@@ -391,11 +358,33 @@ TEST_SUITE("VebTree Set Operations") {
         REQUIRE(s8.empty());
     }
 
+    TEST_CASE("Node64 intersection drops clusters missing from other") {
+        VebTree s1;
+        s1.insert_many(std::vector<size_t>{0, (1ull << 32) + 5, (2ull << 32) + 5, (3ull << 32) + 5, 5ull << 32});
+
+        VebTree s2;
+        s2.insert_many(std::vector<size_t>{0, (1ull << 32) + 5, 5ull << 32});
+
+        s1 &= s2;
+        REQUIRE(s1.size() == 3);
+        REQUIRE(s1.to_vector() == std::vector<size_t>{0, (1ull << 32) + 5, 5ull << 32});
+    }
+
+    TEST_CASE("Node64 xor with a single element") {
+        VebTree s1;
+        s1.insert_many(std::vector<size_t>{1ull << 33, 1ull << 34});
+
+        VebTree s2;
+        s2.insert(3ull << 32);
+
+        s1 ^= s2;
+        REQUIRE(s1.size() == 3);
+        REQUIRE(s1.to_vector() == std::vector<size_t>{1ull << 33, 3ull << 32, 1ull << 34});
+    }
+
     TEST_CASE("set ops with identical large sets") {
         VebTree s1;
-        for (size_t i = 0; i < 10000; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(0, 9999);
 
         VebTree s2{s1};
 
@@ -441,19 +430,13 @@ TEST_SUITE("VebTree Set Operations") {
 
     TEST_CASE("set ops associativity") {
         VebTree s1;
-        for (size_t i = 0; i < 50; ++i) {
-            s1.insert(i);
-        }
+        s1.insert_range(0, 49);
 
         VebTree s2;
-        for (size_t i = 25; i < 75; ++i) {
-            s2.insert(i);
-        }
+        s2.insert_range(25, 74);
 
         VebTree s3;
-        for (size_t i = 50; i < 100; ++i) {
-            s3.insert(i);
-        }
+        s3.insert_range(50, 99);
 
         VebTree left_assoc = s1 | s2;
         left_assoc |= s3;